@@ -0,0 +1,69 @@
+"""
+Compare the schema-resolved row decoders with positional index reads.
+
+Run with: poetry run python -m benchmarks.row_decoders
+"""
+import timeit
+from operator import itemgetter
+
+from topmatchnba.data import LINE_SCORE_DECODER
+from topmatchnba.data import LINE_SCORE_HEADERS
+
+PLAYBYPLAY_HEADERS = [f"COLUMN_{column}" for column in range(33)] + ["SCORE"]
+
+ROWS = 10_000
+REPEAT = 50
+
+
+def read_by_index(line_scores):
+    for line_score in line_scores:
+        game_id = line_score[2]
+        team_id = line_score[3]
+        abbreviation = line_score[4]
+        city_name = line_score[5]
+        name = line_score[6]
+        points = line_score[22]
+    return game_id, team_id, abbreviation, city_name, name, points
+
+
+def read_by_decoder(line_scores):
+    for game_id, team_id, abbreviation, city_name, name, points in map(
+        LINE_SCORE_DECODER, line_scores
+    ):
+        pass
+    return game_id, team_id, abbreviation, city_name, name, points
+
+
+def read_score_by_zip(playbyplay_rows):
+    for row in playbyplay_rows:
+        score_str = dict(zip(PLAYBYPLAY_HEADERS, row)).get("SCORE")
+    return score_str
+
+
+def read_score_by_getter(playbyplay_rows):
+    get_score = itemgetter(PLAYBYPLAY_HEADERS.index("SCORE"))
+    for score_str in map(get_score, playbyplay_rows):
+        pass
+    return score_str
+
+
+def benchmark(name, reader, rows):
+    seconds = min(timeit.repeat(lambda: reader(rows), number=REPEAT, repeat=5))
+    print(f"{name}: {seconds / (REPEAT * ROWS) * 1e9:.1f} ns/row")
+
+
+def main():
+    line_scores = [
+        [f"{header}_{row}" for header in LINE_SCORE_HEADERS] for row in range(ROWS)
+    ]
+    playbyplay_rows = [
+        [f"{header}_{row}" for header in PLAYBYPLAY_HEADERS] for row in range(ROWS)
+    ]
+    benchmark("line score index reads", read_by_index, line_scores)
+    benchmark("line score row decoder", read_by_decoder, line_scores)
+    benchmark("play-by-play dict(zip)", read_score_by_zip, playbyplay_rows)
+    benchmark("play-by-play getter", read_score_by_getter, playbyplay_rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+from datetime import datetime
+
+import pytest
+
+from topmatchnba import backfill
+from topmatchnba.backfill import DONE
+from topmatchnba.backfill import FAILED
+from topmatchnba.backfill import PENDING
+from topmatchnba.backfill import WorkQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = WorkQueue(str(tmp_path / "backfill.sqlite3"), max_attempts=2)
+    queue.enqueue(datetime(2024, 1, 1), datetime(2024, 1, 3))
+    return queue
+
+
+def test_enqueue_ignores_existing_dates(queue):
+    assert queue.enqueue(datetime(2024, 1, 3), datetime(2024, 1, 4)) == 1
+    assert queue.counts()[PENDING] == 4
+
+
+def test_claim_leases_each_date_once(queue):
+    assert queue.claim("worker_1", 600) == datetime(2024, 1, 1)
+    assert queue.claim("worker_2", 600) == datetime(2024, 1, 2)
+    assert queue.claim("worker_1", 600) == datetime(2024, 1, 3)
+    assert queue.claim("worker_2", 600) is None
+
+
+def test_claim_reclaims_expired_lease(queue):
+    game_date = queue.claim("worker_1", -1)
+    assert queue.claim("worker_2", 600) == game_date
+    assert not queue.heartbeat(game_date, "worker_1", 600)
+    assert not queue.complete(game_date, "worker_1")
+    assert queue.complete(game_date, "worker_2")
+
+
+def test_fail_retries_until_max_attempts(queue):
+    game_date = queue.claim("worker_1", 600)
+    queue.fail(game_date, "worker_1", "error")
+    assert queue.claim("worker_1", 600) == game_date
+    queue.fail(game_date, "worker_1", "error")
+    assert queue.counts()[FAILED] == 1
+
+
+def test_run_worker_processes_every_date(queue, monkeypatch):
+    processed = []
+
+    def fake_game_main(game_date, can_save):
+        assert can_save()
+        processed.append(game_date)
+
+    monkeypatch.setattr(backfill, "game_main", fake_game_main)
+
+    backfill.run_worker(queue, "worker_1", heartbeat_interval=0.01, delay=0)
+
+    assert processed == [
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 2),
+        datetime(2024, 1, 3),
+    ]
+    assert queue.counts()[DONE] == 3
+
+
+def test_claim_fails_expired_lease_after_max_attempts(queue):
+    game_date = queue.claim("worker_1", -1)
+    assert queue.claim("worker_2", -1) == game_date
+    assert queue.claim("worker_3", 600) == datetime(2024, 1, 2)
+    assert queue.counts()[FAILED] == 1
+
+
+def test_run_worker_does_not_save_after_losing_lease(queue, monkeypatch):
+    saved = []
+
+    def fake_game_main(game_date, can_save):
+        # Another worker reclaims the date while this one is still fetching.
+        with queue.transaction() as connection:
+            connection.execute(
+                "UPDATE dates SET worker_id = ? WHERE game_date = ?",
+                ("worker_2", game_date.strftime("%Y-%m-%d")),
+            )
+        if can_save():
+            saved.append(game_date)
+
+    monkeypatch.setattr(backfill, "game_main", fake_game_main)
+    monkeypatch.setattr(queue, "counts", lambda: {backfill.LEASED: 0})
+
+    backfill.run_worker(queue, "worker_1", heartbeat_interval=0.01, delay=0)
+
+    assert saved == []
+
+
+def test_run_worker_rejects_heartbeat_longer_than_lease(queue):
+    with pytest.raises(ValueError):
+        backfill.run_worker(queue, "worker_1", lease_seconds=60, heartbeat_interval=60)
@@ -0,0 +1,89 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from tests.helpers import create_test_game
+from topmatchnba import daemon
+from topmatchnba.daemon import DaemonState
+from topmatchnba.data import FINAL_GAME_STATUS_ID
+
+
+def test_poll_games_rates_new_final_games(monkeypatch):
+    scoreboard = {
+        "final": create_test_game("final", game_status_id=FINAL_GAME_STATUS_ID),
+        "rated": create_test_game("rated", game_status_id=FINAL_GAME_STATUS_ID),
+        "live": create_test_game("live", game_status_id=2),
+        "postponed": create_test_game(
+            "postponed", game_status_id=1, game_status_text="PPD"
+        ),
+    }
+    fetched = []
+    saved = []
+
+    def fake_fetch_play_by_play(game_id, proxy):
+        fetched.append(game_id)
+        return 0
+
+    monkeypatch.setattr(
+        daemon, "fetch_nba_game_data", lambda game_date, proxy: scoreboard
+    )
+    monkeypatch.setattr(daemon, "fetch_nba_play_by_play_data", fake_fetch_play_by_play)
+    monkeypatch.setattr(
+        daemon,
+        "save_games",
+        lambda game_date, games: saved.append([game.game_id for game in games]),
+    )
+
+    state = DaemonState(
+        game_date=datetime(2025, 1, 1),
+        rated_games={
+            "rated": create_test_game("rated", game_status_id=FINAL_GAME_STATUS_ID)
+        },
+    )
+
+    assert [game.game_id for game in daemon.poll_games(state)] == ["live"]
+    assert fetched == ["final"]
+    assert set(state.rated_games) == {"final", "rated"}
+    assert len(saved) == 1
+
+    scoreboard["live"].game_status_id = FINAL_GAME_STATUS_ID
+    assert daemon.poll_games(state) == []
+    assert fetched == ["final", "live"]
+
+
+class StopDaemon(Exception):
+    pass
+
+
+def test_run_daemon_moves_on_once_no_game_is_live(monkeypatch):
+    polled_dates = []
+    pending_games = [
+        [create_test_game("live", game_status_id=2)],
+        [create_test_game("suspended", game_status_id=1)],
+        [],
+    ]
+
+    def fake_poll_games(state):
+        polled_dates.append(state.game_date)
+        return pending_games[len(polled_dates) - 1]
+
+    def fake_sleep(seconds):
+        if len(polled_dates) == len(pending_games):
+            raise StopDaemon
+
+    monkeypatch.setattr(
+        daemon, "FreeProxy", lambda https: SimpleNamespace(get=lambda: None)
+    )
+    monkeypatch.setattr(daemon, "poll_games", fake_poll_games)
+    monkeypatch.setattr(daemon, "get_current_game_date", lambda: datetime(2025, 1, 2))
+    monkeypatch.setattr(daemon.time, "sleep", fake_sleep)
+
+    with pytest.raises(StopDaemon):
+        daemon.run_daemon(300, datetime(2025, 1, 1))
+
+    assert polled_dates == [
+        datetime(2025, 1, 1),
+        datetime(2025, 1, 1),
+        datetime(2025, 1, 2),
+    ]
@@ -0,0 +1,76 @@
+from datetime import datetime
+
+import pytest
+
+from topmatchnba.data import compile_row_decoder
+from topmatchnba.data import Game
+from topmatchnba.data import GameRating
+from topmatchnba.data import get_result_set
+from topmatchnba.data import LINE_SCORE_FIELDS
+from topmatchnba.data import process_lead_changes
+from topmatchnba.data import process_team_leaders
+from topmatchnba.data import Team
+from topmatchnba.data import TEAM_LEADERS_FIELDS
+
+
+def test_compile_row_decoder_resolves_fields_by_name():
+    decoder = compile_row_decoder(["A", "B", "C"], ("C", "A"))
+    assert decoder(["a", "b", "c"]) == ("c", "a")
+
+
+def test_compile_row_decoder_single_field():
+    decoder = compile_row_decoder(["A", "B", "C"], ("B",))
+    assert decoder(["a", "b", "c"]) == ("b",)
+
+
+def test_compile_row_decoder_missing_field():
+    with pytest.raises(RuntimeError, match="PTS"):
+        compile_row_decoder(["GAME_ID", "TEAM_ID"], LINE_SCORE_FIELDS)
+
+
+def test_process_team_leaders_with_schema_drift():
+    # The API added a column before PTS, shifting it from index 7 to 8.
+    result_set = {
+        "headers": [
+            "GAME_ID",
+            "TEAM_ID",
+            "TEAM_CITY",
+            "TEAM_NICKNAME",
+            "TEAM_ABBREVIATION",
+            "PTS_PLAYER_ID",
+            "PTS_PLAYER_NAME",
+            "PTS_PLAYER_POSITION",
+            "PTS",
+        ],
+        "data": [["game_id_123", 1, "City", "Name", "ABC", 2, "Player", "G", 42]],
+    }
+    team_leaders, decoder = get_result_set(result_set, TEAM_LEADERS_FIELDS)
+    games = {
+        "game_id_123": Game(
+            date=datetime.now(),
+            game_id="game_id_123",
+            home_team=Team(team_id=1),
+            visitor_team=Team(team_id=2),
+            game_rating=GameRating(),
+        )
+    }
+    process_team_leaders(games, team_leaders, decoder)
+    assert games["game_id_123"].maximum_points_player == 42
+
+
+def test_process_lead_changes():
+    headers = ["EVENTNUM", "SCORE"]
+    rows = [
+        [1, None],
+        [2, "0 - 2"],
+        [3, "3 - 2"],
+        [4, "3 - 3"],
+        [5, "3 - 5"],
+        [6, "bad - score"],
+        [7, "8 - 5"],
+    ]
+    assert process_lead_changes(rows, headers) == 2
+
+
+def test_process_lead_changes_without_score_column():
+    assert process_lead_changes([[1, 2]], ["EVENTNUM", "PERIOD"]) == 0
@@ -0,0 +1,27 @@
+import json
+import os
+
+import pytest
+
+from topmatchnba.files import write_json_atomically
+
+
+def test_write_json_atomically(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text("[]")
+
+    write_json_atomically(str(path), {"a": 1}, indent=2)
+
+    assert json.loads(path.read_text()) == {"a": 1}
+    assert os.listdir(tmp_path) == ["data.json"]
+
+
+def test_write_json_atomically_keeps_previous_file_on_error(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text("[]")
+
+    with pytest.raises(TypeError):
+        write_json_atomically(str(path), {"a": object()})
+
+    assert path.read_text() == "[]"
+    assert os.listdir(tmp_path) == ["data.json"]
@@ -0,0 +1,39 @@
+from datetime import datetime
+
+from topmatchnba.data import Game
+from topmatchnba.data import GameRating
+from topmatchnba.data import Team
+
+
+def create_test_game(
+    game_id="game_id",
+    home_team_points=0,
+    visitor_team_points=0,
+    home_team_position=15,
+    visitor_team_position=15,
+    max_player_points=0,
+    lead_changes=0,
+    game_status_id=0,
+    game_status_text="",
+):
+    return Game(
+        date=datetime(2025, 1, 1),
+        game_id=game_id,
+        home_team=Team(
+            team_id="home_team_id",
+            team_name="Home",
+            conference_position=home_team_position,
+        ),
+        visitor_team=Team(
+            team_id="visitor_team_id",
+            team_name="Visitor",
+            conference_position=visitor_team_position,
+        ),
+        game_rating=GameRating(),
+        home_team_points=home_team_points,
+        visitor_team_points=visitor_team_points,
+        maximum_points_player=max_player_points,
+        lead_changes=lead_changes,
+        game_status_id=game_status_id,
+        game_status_text=game_status_text,
+    )
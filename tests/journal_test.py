@@ -0,0 +1,76 @@
+from datetime import datetime
+
+import pytest
+
+from tests.helpers import create_test_game
+from topmatchnba import journal as topmatchnba_journal
+from topmatchnba import main as topmatchnba_main
+from topmatchnba.journal import load_journal
+from topmatchnba.journal import RunJournal
+
+
+@pytest.fixture(autouse=True)
+def journal_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        topmatchnba_journal,
+        "get_journal_path",
+        lambda game_date: str(tmp_path / f"{game_date:%d-%m-%Y}.json"),
+    )
+
+
+def test_journal_round_trip():
+    game_date = datetime(2025, 1, 1)
+    journal = RunJournal(game_date=game_date, games={"a": create_test_game("a")})
+    journal.games["a"].game_rating.total = 18
+    journal.record_rated_game("a")
+
+    loaded_journal = load_journal(game_date)
+    assert loaded_journal.games == journal.games
+    assert loaded_journal.rated_game_ids == {"a"}
+
+
+def test_load_journal_missing():
+    assert load_journal(datetime(2025, 1, 2)) is None
+
+
+def test_main_resumes_from_journal(monkeypatch):
+    game_date = datetime(2025, 1, 1)
+    scoreboard_fetches = []
+    play_by_play_fetches = []
+    saved = []
+
+    def fake_fetch_game_data(game_date):
+        scoreboard_fetches.append(game_date)
+        return {
+            "a": create_test_game("a"),
+            "b": create_test_game("b"),
+        }
+
+    def fake_fetch_play_by_play(game_id):
+        play_by_play_fetches.append(game_id)
+        if game_id == "b" and len(play_by_play_fetches) == 2:
+            raise RuntimeError("Failed to fetch NBA data PlayByPlayV2")
+        return 12
+
+    monkeypatch.setattr(topmatchnba_main, "get_expected_game_ids", lambda d: None)
+    monkeypatch.setattr(topmatchnba_main, "fetch_nba_game_data", fake_fetch_game_data)
+    monkeypatch.setattr(
+        topmatchnba_main, "fetch_nba_play_by_play_data", fake_fetch_play_by_play
+    )
+    monkeypatch.setattr(
+        topmatchnba_main,
+        "save_games",
+        lambda game_date, games, **kwargs: saved.append(
+            [game.game_id for game in games]
+        ),
+    )
+
+    with pytest.raises(RuntimeError):
+        topmatchnba_main.main(game_date)
+    assert load_journal(game_date).rated_game_ids == {"a"}
+
+    topmatchnba_main.main(game_date)
+    assert len(scoreboard_fetches) == 1
+    assert play_by_play_fetches == ["a", "b", "b"]
+    assert saved == [["a", "b"]]
+    assert load_journal(game_date) is None
@@ -0,0 +1,72 @@
+import json
+
+from topmatchnba import percentile
+from topmatchnba.percentile import get_season
+from topmatchnba.percentile import load_season_ranking
+from topmatchnba.percentile import save_season_ranking
+from topmatchnba.percentile import SeasonRanking
+from topmatchnba.percentile import seed_season_rankings
+
+
+def test_get_season():
+    assert get_season("0022400459") == "2024"
+    assert get_season("0042300101") == "2023"
+
+
+def test_season_ranking_rank_and_percentile():
+    season_ranking = SeasonRanking(season="2024")
+    for game_id, total in [("a", 6), ("b", 20), ("c", 12), ("d", 12)]:
+        season_ranking.add(game_id, total)
+
+    assert season_ranking.sorted_ratings == [6, 12, 12, 20]
+    assert season_ranking.rank(20) == 1
+    assert season_ranking.rank(12) == 2
+    assert season_ranking.rank(6) == 4
+    assert season_ranking.percentile(12) == 75.0
+    assert season_ranking.percentile(6) == 25.0
+
+
+def test_season_ranking_add_replaces_previous_rating():
+    season_ranking = SeasonRanking(season="2024")
+    season_ranking.add("a", 6)
+    season_ranking.add("a", 18)
+
+    assert season_ranking.ratings == {"a": 18}
+    assert season_ranking.sorted_ratings == [18]
+
+
+def test_season_ranking_percentile_empty():
+    assert SeasonRanking(season="2024").percentile(10) == 0.0
+
+
+def test_seed_season_rankings(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        percentile,
+        "get_season_ranking_path",
+        lambda season: str(tmp_path / f"season-ratings-{season}.json"),
+    )
+    days = {
+        "01-01-2025": [
+            {"game": {"game_id": "0022400459"}, "game_rating_total": 18},
+            {"game": {"game_id": "0022400460"}, "game_rating_total": 6},
+        ],
+        # Entries of the previous rating scale are not seeded.
+        "01-01-2024": [{"game": {"game_id": "0022300459"}, "game_punctuation": 10}],
+    }
+    for day, entries in days.items():
+        (tmp_path / f"topmatchnba-{day}.json").write_text(json.dumps(entries))
+    season_ranking = SeasonRanking(season="2024")
+    season_ranking.add("0022400459", 4)
+    season_ranking.add("0022400500", 12)
+    save_season_ranking(season_ranking)
+
+    season_rankings = seed_season_rankings(str(tmp_path))
+
+    assert list(season_rankings) == ["2024"]
+    assert load_season_ranking("2024").ratings == {
+        "0022400459": 18,
+        "0022400460": 6,
+        "0022400500": 12,
+    }
+    assert load_season_ranking("2024").sorted_ratings == [6, 12, 18]
+    assert load_season_ranking("2023").sorted_ratings == []
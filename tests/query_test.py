@@ -0,0 +1,106 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from topmatchnba.query import GameFilter
+from topmatchnba.query import run_query
+from topmatchnba.query import split_date_range
+
+
+def create_entry(game_id, total, home_team, visitor_team, change_lead=None):
+    game = {
+        "game_id": game_id,
+        "home_team": {
+            "team_abbreviation": home_team[:3].upper(),
+            "team_name": home_team,
+            "conference": "West",
+        },
+        "visitor_team": {
+            "team_abbreviation": visitor_team[:3].upper(),
+            "team_name": visitor_team,
+            "conference": "East",
+        },
+    }
+    if change_lead is None:
+        return {"game": game, "game_punctuation": total}
+    game["game_rating"] = {"change_lead": change_lead, "total": total}
+    return {"game": game, "game_rating_total": total}
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    days = {
+        "01-01-2025": [
+            create_entry("a", 20, "Lakers", "Celtics", change_lead=10),
+            create_entry("b", 8, "Suns", "Knicks", change_lead=2),
+        ],
+        "02-01-2025": [
+            create_entry("c", 14, "Jazz", "Heat", change_lead=6),
+        ],
+        "09-01-2025": [
+            create_entry("d", 18, "Kings", "Bulls"),
+            create_entry("e", 4, "Lakers", "Nets"),
+        ],
+    }
+    for day, entries in days.items():
+        (tmp_path / f"topmatchnba-{day}.json").write_text(json.dumps(entries))
+    (tmp_path / "season-ratings-2024.json").write_text("{}")
+    return str(tmp_path)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_query_top_games(data_dir, workers):
+    games = run_query(
+        3, datetime(2025, 1, 1), datetime(2025, 1, 31), GameFilter(), workers, data_dir
+    )
+    assert [game[2] for game in games] == ["a", "c", "b"]
+
+
+def test_run_query_include_old_scale(data_dir):
+    games = run_query(
+        3,
+        datetime(2025, 1, 1),
+        datetime(2025, 1, 31),
+        GameFilter(include_old_scale=True),
+        data_dir=data_dir,
+    )
+    assert [game[2] for game in games] == ["a", "d", "c"]
+
+
+def test_run_query_filters(data_dir):
+    start_date, end_date = datetime(2025, 1, 1), datetime(2025, 1, 31)
+    lakers = run_query(
+        10,
+        start_date,
+        end_date,
+        GameFilter(team="lakers", include_old_scale=True),
+        data_dir=data_dir,
+    )
+    close_games = run_query(
+        10,
+        start_date,
+        end_date,
+        GameFilter(min_rating_components={"change_lead": 6}, include_old_scale=True),
+        data_dir=data_dir,
+    )
+    assert [game[2] for game in lakers] == ["a", "e"]
+    assert [game[2] for game in close_games] == ["a", "c"]
+
+
+def test_run_query_best_game_per_week(data_dir):
+    games = run_query(
+        None,
+        datetime(2025, 1, 1),
+        datetime(2025, 1, 31),
+        GameFilter(include_old_scale=True),
+        data_dir=data_dir,
+    )
+    assert [game[2] for game in games] == ["a", "d"]
+
+
+def test_split_date_range():
+    assert split_date_range(datetime(2025, 1, 1), datetime(2025, 1, 5), 2) == [
+        (datetime(2025, 1, 1), datetime(2025, 1, 3)),
+        (datetime(2025, 1, 4), datetime(2025, 1, 5)),
+    ]
@@ -0,0 +1,69 @@
+import argparse
+
+import pytest
+
+from tests.helpers import create_test_game
+from topmatchnba import main as topmatchnba_main
+from topmatchnba.arguments import positive_int
+from topmatchnba.rating import calculate_game_rating
+from topmatchnba.rating import calculate_rating_bounds
+
+
+def test_calculate_rating_bounds_contains_rating():
+    game = create_test_game("game_1", 100, 98, 5, 4, 30, lead_changes=12)
+    lower, upper = calculate_rating_bounds(game)
+    calculate_game_rating(game)
+    assert lower == 12
+    assert upper == 22
+    assert lower <= game.game_rating.total <= upper
+
+
+def test_select_top_games_matches_full_run(monkeypatch):
+    lead_changes = {
+        "blowout_1": 20,
+        "blowout_2": 0,
+        "close_1": 2,
+        "close_2": 18,
+        "close_3": 8,
+        "blowout_3": 5,
+    }
+    fetched = []
+
+    def fake_fetch(game_id):
+        fetched.append(game_id)
+        return lead_changes[game_id]
+
+    monkeypatch.setattr(topmatchnba_main, "fetch_nba_play_by_play_data", fake_fetch)
+
+    def build_games():
+        return {
+            "blowout_1": create_test_game("blowout_1", 120, 90),
+            "blowout_2": create_test_game("blowout_2", 130, 95),
+            "close_1": create_test_game("close_1", 100, 99, 1, 2),
+            "close_2": create_test_game("close_2", 101, 98, 3, 4),
+            "close_3": create_test_game("close_3", 99, 94),
+            "blowout_3": create_test_game("blowout_3", 115, 100),
+        }
+
+    full_run = []
+    for game in build_games().values():
+        game.lead_changes = lead_changes[game.game_id]
+        full_run.append(calculate_game_rating(game))
+    full_run.sort(key=lambda game: game.game_rating.total, reverse=True)
+
+    top_games = topmatchnba_main.select_top_games(build_games(), 2)
+
+    assert [game.game_id for game in top_games] == [
+        game.game_id for game in full_run[:2]
+    ]
+    assert fetched == ["close_1", "close_2"]
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "two"])
+def test_positive_int_rejects_invalid_values(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        positive_int(value)
+
+
+def test_positive_int():
+    assert positive_int("3") == 3
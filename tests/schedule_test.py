@@ -0,0 +1,106 @@
+from datetime import datetime
+
+import pytest
+
+from topmatchnba import main as topmatchnba_main
+from topmatchnba import schedule
+from topmatchnba.schedule import get_expected_game_ids
+from topmatchnba.schedule import get_season_for_date
+from topmatchnba.schedule import plan_dates
+from topmatchnba.schedule import process_schedule_game_dates
+from topmatchnba.schedule import save_season_schedule
+from topmatchnba.schedule import SeasonSchedule
+
+
+@pytest.fixture(autouse=True)
+def schedule_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        schedule,
+        "get_season_schedule_path",
+        lambda season: str(tmp_path / f"schedule-{season}.json"),
+    )
+
+
+@pytest.fixture
+def fetched_seasons(monkeypatch):
+    fetched_seasons = []
+
+    def fake_fetch_season_schedule(season):
+        fetched_seasons.append(season)
+        return SeasonSchedule(
+            season=season,
+            fetched_at=datetime(2025, 1, 4, 6),
+            game_ids_by_date={
+                "2025-01-01": ["0022400459", "0022400460"],
+                "2025-01-03": ["0022400470"],
+            },
+        )
+
+    monkeypatch.setattr(schedule, "fetch_season_schedule", fake_fetch_season_schedule)
+    return fetched_seasons
+
+
+def test_get_season_for_date():
+    assert get_season_for_date(datetime(2024, 10, 22)) == "2024"
+    assert get_season_for_date(datetime(2025, 4, 13)) == "2024"
+
+
+def test_plan_dates_skips_dates_without_games(fetched_seasons):
+    planned_dates = plan_dates(datetime(2025, 1, 1), datetime(2025, 1, 5))
+
+    assert planned_dates == [
+        (datetime(2025, 1, 1), ["0022400459", "0022400460"]),
+        (datetime(2025, 1, 3), ["0022400470"]),
+        (datetime(2025, 1, 4), None),
+        (datetime(2025, 1, 5), None),
+    ]
+    assert fetched_seasons == ["2024"]
+
+
+def test_plan_dates_uses_cached_schedule(fetched_seasons):
+    save_season_schedule(SeasonSchedule(season="2024", fetched_at=datetime(2025, 2, 2)))
+
+    assert plan_dates(datetime(2025, 1, 1), datetime(2025, 1, 31)) == []
+    assert fetched_seasons == []
+
+
+def test_get_expected_game_ids(fetched_seasons):
+    assert get_expected_game_ids(datetime(2025, 1, 1)) == ["0022400459", "0022400460"]
+    assert get_expected_game_ids(datetime(2025, 1, 2)) == []
+    assert get_expected_game_ids(datetime(2025, 1, 4)) is None
+    # The cached schedule covers the first two dates, the last one is refetched.
+    assert fetched_seasons == ["2024", "2024"]
+
+
+def test_process_schedule_game_dates():
+    game_dates = [
+        {
+            "gameDate": "10/04/2024 00:00:00",
+            "games": [{"gameId": "0012400001", "gameDateEst": "2024-10-04T00:00:00Z"}],
+        },
+        {
+            "gameDate": "12/17/2024 00:00:00",
+            "games": [
+                {"gameId": "0062400001", "gameDateEst": "2024-12-17T00:00:00Z"},
+            ],
+        },
+    ]
+
+    assert process_schedule_game_dates(game_dates) == {
+        "2024-10-04": ["0012400001"],
+        "2024-12-17": ["0062400001"],
+    }
+
+
+def test_main_skips_dates_without_games(monkeypatch):
+    fetched = []
+    monkeypatch.setattr(topmatchnba_main, "load_journal", lambda game_date: None)
+    monkeypatch.setattr(topmatchnba_main, "get_expected_game_ids", lambda d: [])
+    monkeypatch.setattr(topmatchnba_main, "fetch_nba_game_data", fetched.append)
+    monkeypatch.setattr(
+        topmatchnba_main, "save_games", lambda *args, **kwargs: fetched.append(args)
+    )
+
+    topmatchnba_main.main(datetime(2025, 1, 2))
+
+    assert fetched == []
@@ -0,0 +1,98 @@
+import json
+from itertools import product
+
+import numpy as np
+
+from tests.helpers import create_test_game
+from topmatchnba.rating import calculate_game_rating
+from topmatchnba.sweep import BASELINE_SCALES
+from topmatchnba.sweep import generate_scales
+from topmatchnba.sweep import History
+from topmatchnba.sweep import load_history
+from topmatchnba.sweep import score_games
+from topmatchnba.sweep import summarize
+
+
+def test_baseline_scales_match_calculate_game_rating():
+    games = [
+        create_test_game(
+            home_team_points=100 + score_difference,
+            visitor_team_points=100,
+            home_team_position=home_position,
+            visitor_team_position=visitor_position,
+            max_player_points=maximum_points_player,
+            lead_changes=lead_changes,
+        )
+        for (
+            home_position,
+            visitor_position,
+            score_difference,
+            maximum_points_player,
+            lead_changes,
+        ) in product(
+            [0, 1, 2, 3, 4, 5, 7, 8, 15],
+            [1, 3, 4, 8],
+            [0, 1, 2, 3, 5, 6, 9, 10, 30],
+            [30, 40, 41, 50, 51],
+            [0, 3, 4, 6, 7, 10, 11, 16, 17],
+        )
+    ]
+    positions = np.array(
+        [
+            (game.home_team.conference_position, game.visitor_team.conference_position)
+            for game in games
+        ]
+    )
+    history = History(
+        day=np.zeros(len(games), dtype=int),
+        score_difference=np.array(
+            [game.home_team_points - game.visitor_team_points for game in games]
+        ),
+        best_position=positions.min(axis=1),
+        worst_position=positions.max(axis=1),
+        maximum_points_player=np.array([game.maximum_points_player for game in games]),
+        lead_changes=np.array([game.lead_changes for game in games]),
+    )
+
+    totals = score_games(history, BASELINE_SCALES)[0]
+
+    assert totals.tolist() == [
+        calculate_game_rating(game).game_rating.total for game in games
+    ]
+
+
+def test_generate_scales_keeps_baseline_first():
+    scales = generate_scales(100, seed=1)
+    assert len(scales) == 100
+    assert scales.describe(0) == BASELINE_SCALES.describe(0)
+    assert (np.diff(scales.change_lead_thresholds, axis=1) <= 0).all()
+    assert (np.diff(scales.score_difference_thresholds, axis=1) >= 0).all()
+
+
+def test_load_history_and_summarize(tmp_path):
+    def create_entry(score_difference, lead_changes):
+        return {
+            "game": {
+                "home_team": {"conference_position": 1},
+                "visitor_team": {"conference_position": 9},
+                "home_team_points": 100 + score_difference,
+                "visitor_team_points": 100,
+                "maximum_points_player": 30,
+                "lead_changes": lead_changes,
+            }
+        }
+
+    days = {
+        "01-01-2025": [create_entry(1, 20), create_entry(20, 0)],
+        "02-01-2025": [create_entry(3, 8)],
+    }
+    for day, entries in days.items():
+        (tmp_path / f"topmatchnba-{day}.json").write_text(json.dumps(entries))
+
+    history = load_history(data_dir=str(tmp_path))
+    assert history.day.tolist() == [0, 0, 1]
+
+    statistics = summarize(history, generate_scales(10))
+    assert statistics[0]["maximum_total"] == 32
+    assert statistics[0]["observed_maximum"] == 22
+    assert statistics[0]["best_game_agreement"] == 1.0
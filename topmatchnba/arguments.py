@@ -0,0 +1,18 @@
+import argparse
+
+
+def positive_int(value: str) -> int:
+    """
+    Parse a strictly positive integer command line argument.
+
+    :param value: The raw argument value.
+    :return: The parsed integer.
+    :raises argparse.ArgumentTypeError: If the value is not a positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return number
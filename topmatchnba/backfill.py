@@ -0,0 +1,348 @@
+import argparse
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from contextlib import contextmanager
+from datetime import datetime
+from datetime import timedelta
+
+from topmatchnba.main import main as game_main
+from topmatchnba.schedule import plan_dates
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+
+class WorkQueue:
+    """
+    SQLite backed queue of game dates to backfill.
+
+    Workers claim a date with a lease that expires unless it is renewed with
+    heartbeats, so dates held by crashed workers are reclaimed automatically.
+    """
+
+    def __init__(self, path: str, max_attempts: int = 5):
+        self.path = path
+        self.max_attempts = max_attempts
+        with self.transaction() as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS dates (
+                    game_date TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    worker_id TEXT,
+                    lease_expires REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT
+                )
+                """
+            )
+
+    @contextmanager
+    def transaction(self):
+        # Each operation uses its own connection, so the queue can be used from
+        # the heartbeat thread, and takes the write lock up front.
+        with closing(
+            sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        ) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def enqueue(self, start_date: datetime, end_date: datetime) -> int:
+        """
+        Add every date between start_date and end_date, both included, to the queue.
+
+        Dates already in the queue are left untouched.
+
+        :param start_date: The first date to backfill.
+        :param end_date: The last date to backfill.
+        :return: The number of dates added.
+        """
+        game_dates = []
+        current_date = start_date
+        while current_date <= end_date:
+            game_dates.append(current_date)
+            current_date += timedelta(days=1)
+        return self.enqueue_dates(game_dates)
+
+    def enqueue_dates(self, game_dates: list[datetime]) -> int:
+        """
+        Add the given dates to the queue, leaving dates already in it untouched.
+
+        :param game_dates: The dates to backfill.
+        :return: The number of dates added.
+        """
+        with self.transaction() as connection:
+            cursor = connection.executemany(
+                "INSERT OR IGNORE INTO dates (game_date, status) VALUES (?, ?)",
+                [(game_date.strftime("%Y-%m-%d"), PENDING) for game_date in game_dates],
+            )
+            return cursor.rowcount
+
+    def claim(self, worker_id: str, lease_seconds: float) -> datetime | None:
+        """
+        Lease the earliest pending date, or a date whose lease has expired.
+
+        Expired leases of dates that reached max_attempts are marked as failed.
+
+        :param worker_id: The identifier of the claiming worker.
+        :param lease_seconds: Seconds until the lease expires without a heartbeat.
+        :return: The claimed date, or None if there is no date to claim.
+        """
+        now = time.time()
+        with self.transaction() as connection:
+            # Expired leases that used up their attempts are not retried again.
+            connection.execute(
+                """
+                UPDATE dates SET status = ?, lease_expires = NULL
+                WHERE status = ? AND lease_expires < ? AND attempts >= ?
+                """,
+                (FAILED, LEASED, now, self.max_attempts),
+            )
+            row = connection.execute(
+                """
+                SELECT game_date FROM dates
+                WHERE status = ? OR (status = ? AND lease_expires < ?)
+                ORDER BY game_date
+                LIMIT 1
+                """,
+                (PENDING, LEASED, now),
+            ).fetchone()
+            if row is None:
+                return None
+
+            connection.execute(
+                """
+                UPDATE dates
+                SET status = ?,
+                    worker_id = ?,
+                    lease_expires = ?,
+                    attempts = attempts + 1
+                WHERE game_date = ?
+                """,
+                (LEASED, worker_id, now + lease_seconds, row[0]),
+            )
+        return datetime.fromisoformat(row[0])
+
+    def heartbeat(
+        self, game_date: datetime, worker_id: str, lease_seconds: float
+    ) -> bool:
+        """
+        Renew the lease of a date held by the worker.
+
+        :param game_date: The leased date.
+        :param worker_id: The identifier of the worker holding the lease.
+        :param lease_seconds: Seconds until the renewed lease expires.
+        :return: False if the worker no longer holds the lease.
+        """
+        with self.transaction() as connection:
+            cursor = connection.execute(
+                """
+                UPDATE dates SET lease_expires = ?
+                WHERE game_date = ? AND status = ? AND worker_id = ?
+                """,
+                (
+                    time.time() + lease_seconds,
+                    game_date.strftime("%Y-%m-%d"),
+                    LEASED,
+                    worker_id,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, game_date: datetime, worker_id: str) -> bool:
+        """
+        Mark a date held by the worker as done.
+
+        :param game_date: The leased date.
+        :param worker_id: The identifier of the worker holding the lease.
+        :return: False if the worker no longer holds the lease.
+        """
+        with self.transaction() as connection:
+            cursor = connection.execute(
+                """
+                UPDATE dates SET status = ?, lease_expires = NULL, last_error = NULL
+                WHERE game_date = ? AND status = ? AND worker_id = ?
+                """,
+                (DONE, game_date.strftime("%Y-%m-%d"), LEASED, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, game_date: datetime, worker_id: str, error: str) -> None:
+        """
+        Release a date held by the worker after a failure.
+
+        The date goes back to pending until it reaches max_attempts, then it is
+        marked as failed.
+
+        :param game_date: The leased date.
+        :param worker_id: The identifier of the worker holding the lease.
+        :param error: The error message to record.
+        """
+        with self.transaction() as connection:
+            connection.execute(
+                """
+                UPDATE dates
+                SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END,
+                    lease_expires = NULL,
+                    last_error = ?
+                WHERE game_date = ? AND status = ? AND worker_id = ?
+                """,
+                (
+                    self.max_attempts,
+                    FAILED,
+                    PENDING,
+                    error,
+                    game_date.strftime("%Y-%m-%d"),
+                    LEASED,
+                    worker_id,
+                ),
+            )
+
+    def counts(self) -> dict[str, int]:
+        """
+        Count the dates in the queue by status.
+
+        :return: A dictionary mapping each status to its number of dates.
+        """
+        with self.transaction() as connection:
+            rows = connection.execute(
+                "SELECT status, COUNT(*) FROM dates GROUP BY status"
+            ).fetchall()
+        return {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0, **dict(rows)}
+
+
+def keep_lease(
+    queue: WorkQueue,
+    game_date: datetime,
+    worker_id: str,
+    lease_seconds: float,
+    heartbeat_interval: float,
+    stop: threading.Event,
+) -> None:
+    while not stop.wait(heartbeat_interval):
+        if not queue.heartbeat(game_date, worker_id, lease_seconds):
+            print(f"Lost the lease for {game_date.strftime('%Y-%m-%d')}")
+            return
+
+
+def run_worker(
+    queue: WorkQueue,
+    worker_id: str,
+    lease_seconds: float = 600,
+    heartbeat_interval: float = 60,
+    delay: float = 5,
+) -> None:
+    """
+    Claim and process dates until every date in the queue is done or failed.
+
+    While other workers still hold leases, the worker waits so it can reclaim
+    their dates if the leases expire.
+
+    :param queue: The WorkQueue to process.
+    :param worker_id: The identifier of this worker.
+    :param lease_seconds: Seconds until a lease expires without a heartbeat.
+    :param heartbeat_interval: Seconds between lease renewals.
+    :param delay: Seconds to sleep after each processed date.
+    :raises ValueError: If heartbeat_interval is not shorter than lease_seconds.
+    """
+    if heartbeat_interval >= lease_seconds:
+        raise ValueError("heartbeat_interval must be shorter than lease_seconds")
+
+    while True:
+        game_date = queue.claim(worker_id, lease_seconds)
+        if game_date is None:
+            if queue.counts()[LEASED] == 0:
+                return
+            time.sleep(heartbeat_interval)
+            continue
+
+        print(f"Fetching data for: {game_date.strftime('%Y-%m-%d')}")
+        stop = threading.Event()
+        heartbeat = threading.Thread(
+            target=keep_lease,
+            args=(queue, game_date, worker_id, lease_seconds, heartbeat_interval, stop),
+            daemon=True,
+        )
+        heartbeat.start()
+        try:
+            # Renew the lease right before writing, so a worker whose date was
+            # reclaimed never overwrites the output of the new holder.
+            game_main(
+                game_date,
+                can_save=lambda: queue.heartbeat(game_date, worker_id, lease_seconds),
+            )
+        except Exception as e:
+            print(f"Error fetching data for {game_date.strftime('%Y-%m-%d')}: {e}")
+            queue.fail(game_date, worker_id, str(e))
+        else:
+            if not queue.complete(game_date, worker_id):
+                print(
+                    f"Lost the lease for {game_date.strftime('%Y-%m-%d')} "
+                    "before completing it"
+                )
+        finally:
+            stop.set()
+            heartbeat.join()
+
+        time.sleep(delay)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill NBA games in parallel.")
+    parser.add_argument(
+        "--queue",
+        default=os.path.join(os.path.dirname(__file__), "..", "backfill.sqlite3"),
+        help="Path of the SQLite work queue, shared by all workers.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    enqueue_parser = subparsers.add_parser("enqueue", help="Add dates to the queue.")
+    enqueue_parser.add_argument("start_date", type=datetime.fromisoformat)
+    enqueue_parser.add_argument("end_date", type=datetime.fromisoformat)
+    enqueue_parser.add_argument(
+        "--all-dates",
+        action="store_true",
+        help="Add every date instead of only the dates with scheduled games.",
+    )
+
+    work_parser = subparsers.add_parser("work", help="Process dates from the queue.")
+    work_parser.add_argument(
+        "--worker-id", default=f"{socket.gethostname()}-{os.getpid()}"
+    )
+    work_parser.add_argument("--lease", type=float, default=600)
+    work_parser.add_argument("--heartbeat", type=float, default=60)
+    work_parser.add_argument("--delay", type=float, default=5)
+
+    subparsers.add_parser("status", help="Show the number of dates by status.")
+
+    args = parser.parse_args()
+    if args.command == "work" and args.heartbeat >= args.lease:
+        parser.error("--heartbeat must be shorter than --lease")
+    queue = WorkQueue(args.queue)
+    if args.command == "enqueue":
+        if args.all_dates:
+            added = queue.enqueue(args.start_date, args.end_date)
+        else:
+            planned_dates = plan_dates(args.start_date, args.end_date)
+            added = queue.enqueue_dates([game_date for game_date, _ in planned_dates])
+        print(f"Added {added} dates to the queue.")
+    elif args.command == "work":
+        run_worker(queue, args.worker_id, args.lease, args.heartbeat, args.delay)
+    else:
+        for status, count in queue.counts().items():
+            print(f"{status}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import argparse
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+
+from fp.fp import FreeProxy
+
+from topmatchnba.arguments import positive_int
+from topmatchnba.data import fetch_nba_game_data
+from topmatchnba.data import fetch_nba_play_by_play_data
+from topmatchnba.data import FINAL_GAME_STATUS_ID
+from topmatchnba.data import Game
+from topmatchnba.data import GAME_DATE_TIMEZONE
+from topmatchnba.data import LIVE_GAME_STATUS_ID
+from topmatchnba.main import save_games
+from topmatchnba.rating import calculate_game_rating
+
+# GAME_STATUS_TEXT of games that will not be played on their date.
+UNPLAYED_GAME_STATUS_TEXTS = ("ppd", "postponed", "cancelled", "canceled")
+
+
+@dataclass
+class DaemonState:
+    game_date: datetime
+    rated_games: dict[str, Game] = field(default_factory=dict)
+    proxy: str | None = None
+
+
+def get_current_game_date() -> datetime:
+    """
+    Get the current NBA game date, at midnight.
+
+    :return: Today's date in the US Eastern time zone as a naive datetime.
+    """
+    now = datetime.now(GAME_DATE_TIMEZONE)
+    return datetime(now.year, now.month, now.day)
+
+
+def is_game_settled(game: Game) -> bool:
+    """
+    Check if a game needs no more polling on its date.
+
+    :param game: The Game object to check.
+    :return: True if the game is final, postponed or cancelled.
+    """
+    return (
+        game.game_status_id == FINAL_GAME_STATUS_ID
+        or game.game_status_text.lower() in UNPLAYED_GAME_STATUS_TEXTS
+    )
+
+
+def poll_games(state: DaemonState) -> list[Game]:
+    """
+    Fetch the scoreboard of the state's game date and rate every game that has
+    gone final since the last poll, updating the day's JSON output after each one.
+
+    :param state: The DaemonState holding the game date and the games rated so far.
+    :return: The games of the date that are not settled yet.
+    :raises RuntimeError: If fetching NBA data fails.
+    """
+    games = fetch_nba_game_data(state.game_date, state.proxy)
+
+    for game in games.values():
+        if (
+            game.game_status_id != FINAL_GAME_STATUS_ID
+            or game.game_id in state.rated_games
+        ):
+            continue
+
+        game.lead_changes = fetch_nba_play_by_play_data(game.game_id, state.proxy)
+        # calculate_game_rating updates game.game_rating in place.
+        calculate_game_rating(game)
+        state.rated_games[game.game_id] = game
+
+        sorted_games = sorted(
+            state.rated_games.values(),
+            key=lambda game: game.game_rating.total,
+            reverse=True,
+        )
+        save_games(state.game_date, sorted_games)
+
+    return [game for game in games.values() if not is_game_settled(game)]
+
+
+def run_daemon(poll_interval: int, game_date: datetime | None = None) -> None:
+    """
+    Poll the scoreboard forever, rating games as soon as they go final.
+
+    The proxy is kept between polls and only resolved again after a failure.
+    The daemon continues with the next game date once the calendar has moved on
+    and no game of the date is live. Games that have not started by then, such
+    as suspended games with no postponed status yet, are left unrated.
+
+    :param poll_interval: Seconds to wait between scoreboard polls.
+    :param game_date: The first date to follow, today's game date by default.
+    """
+    state = DaemonState(game_date=game_date or get_current_game_date())
+
+    while True:
+        pending_games: list[Game] | None
+        try:
+            if state.proxy is None:
+                state.proxy = FreeProxy(https=True).get()
+            pending_games = poll_games(state)
+        except Exception as e:
+            print(
+                f"Error polling games for {state.game_date.strftime('%Y-%m-%d')}: {e}"
+            )
+            state.proxy = None
+            pending_games = None
+
+        current_game_date = get_current_game_date()
+        if (
+            pending_games is not None
+            and current_game_date > state.game_date
+            and not any(
+                game.game_status_id == LIVE_GAME_STATUS_ID for game in pending_games
+            )
+        ):
+            if pending_games:
+                print(
+                    "Leaving unfinished games: "
+                    + ", ".join(game.game_id for game in pending_games)
+                )
+            print(f"Following games for: {current_game_date.strftime('%Y-%m-%d')}")
+            state = DaemonState(game_date=current_game_date, proxy=state.proxy)
+
+        time.sleep(poll_interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rate NBA games as they go final.")
+    parser.add_argument(
+        "--interval",
+        type=positive_int,
+        default=300,
+        help="Seconds between scoreboard polls (300 by default).",
+    )
+    parser.add_argument(
+        "--date",
+        type=datetime.fromisoformat,
+        help="First date to follow in YYYY-MM-DD format (today by default).",
+    )
+    args = parser.parse_args()
+    run_daemon(args.interval, args.date)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,133 @@
+from collections.abc import Callable
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
+from operator import itemgetter
 from typing import Any
+from zoneinfo import ZoneInfo
 
 from fp.fp import FreeProxy
 from nba_api.stats.endpoints import playbyplayv2
 from nba_api.stats.endpoints import scoreboardv2
 
 
+RowDecoder = Callable[[Sequence[Any]], tuple[Any, ...]]
+
+# NBA game dates follow the US Eastern time zone.
+GAME_DATE_TIMEZONE = ZoneInfo("America/New_York")
+
+# GAME_STATUS_ID of a game in progress and of a game that has finished.
+LIVE_GAME_STATUS_ID = 2
+FINAL_GAME_STATUS_ID = 3
+
+# Columns read from each ScoreboardV2 result set, in the order they are decoded.
+GAME_HEADER_FIELDS = (
+    "GAME_DATE_EST",
+    "GAME_ID",
+    "GAME_STATUS_ID",
+    "GAME_STATUS_TEXT",
+    "HOME_TEAM_ID",
+    "VISITOR_TEAM_ID",
+)
+LINE_SCORE_FIELDS = (
+    "GAME_ID",
+    "TEAM_ID",
+    "TEAM_ABBREVIATION",
+    "TEAM_CITY_NAME",
+    "TEAM_NAME",
+    "PTS",
+)
+TEAM_LEADERS_FIELDS = ("GAME_ID", "PTS")
+CONF_STANDINGS_FIELDS = ("TEAM_ID", "CONFERENCE")
+
+# Result set headers as returned by ScoreboardV2.
+GAME_HEADER_HEADERS = [
+    "GAME_DATE_EST",
+    "GAME_SEQUENCE",
+    "GAME_ID",
+    "GAME_STATUS_ID",
+    "GAME_STATUS_TEXT",
+    "GAMECODE",
+    "HOME_TEAM_ID",
+    "VISITOR_TEAM_ID",
+]
+LINE_SCORE_HEADERS = [
+    "GAME_DATE_EST",
+    "GAME_SEQUENCE",
+    "GAME_ID",
+    "TEAM_ID",
+    "TEAM_ABBREVIATION",
+    "TEAM_CITY_NAME",
+    "TEAM_NAME",
+    "TEAM_WINS_LOSSES",
+    "PTS_QTR1",
+    "PTS_QTR2",
+    "PTS_QTR3",
+    "PTS_QTR4",
+    "PTS_OT1",
+    "PTS_OT2",
+    "PTS_OT3",
+    "PTS_OT4",
+    "PTS_OT5",
+    "PTS_OT6",
+    "PTS_OT7",
+    "PTS_OT8",
+    "PTS_OT9",
+    "PTS_OT10",
+    "PTS",
+]
+TEAM_LEADERS_HEADERS = [
+    "GAME_ID",
+    "TEAM_ID",
+    "TEAM_CITY",
+    "TEAM_NICKNAME",
+    "TEAM_ABBREVIATION",
+    "PTS_PLAYER_ID",
+    "PTS_PLAYER_NAME",
+    "PTS",
+]
+CONF_STANDINGS_HEADERS = [
+    "TEAM_ID",
+    "LEAGUE_ID",
+    "SEASON_ID",
+    "STANDINGSDATE",
+    "CONFERENCE",
+]
+
+
+def compile_row_decoder(headers: Sequence[str], fields: Sequence[str]) -> RowDecoder:
+    """
+    Compile a decoder that extracts the given fields from a result set row in one call.
+
+    Column positions are resolved once from the result set headers, so a decoder
+    keeps working if the API adds or reorders columns.
+
+    :param headers: The headers of the result set.
+    :param fields: The columns to extract.
+    :return: A callable returning a tuple with the fields of a row.
+    :raises RuntimeError: If any of the fields is missing from the headers.
+    """
+    missing_fields = [field for field in fields if field not in headers]
+    if missing_fields:
+        raise RuntimeError(
+            f"Result set is missing expected columns: {', '.join(missing_fields)}"
+        )
+    indexes = [list(headers).index(field) for field in fields]
+    if len(indexes) == 1:
+        # itemgetter returns a bare value for a single index.
+        index = indexes[0]
+        return lambda row: (row[index],)
+    return itemgetter(*indexes)
+
+
+GAME_HEADER_DECODER = compile_row_decoder(GAME_HEADER_HEADERS, GAME_HEADER_FIELDS)
+LINE_SCORE_DECODER = compile_row_decoder(LINE_SCORE_HEADERS, LINE_SCORE_FIELDS)
+TEAM_LEADERS_DECODER = compile_row_decoder(TEAM_LEADERS_HEADERS, TEAM_LEADERS_FIELDS)
+CONF_STANDINGS_DECODER = compile_row_decoder(
+    CONF_STANDINGS_HEADERS, CONF_STANDINGS_FIELDS
+)
+
+
 @dataclass
 class Team:
     team_id: str
@@ -37,17 +158,23 @@ class Game:
     visitor_team_points: int = 0
     maximum_points_player: int = 0
     lead_changes: int = 0
+    game_status_id: int = 0
+    game_status_text: str = ""
 
 
-def fetch_nba_game_data(game_date: datetime) -> dict[str, Game]:
+def fetch_nba_game_data(
+    game_date: datetime, proxy: str | None = None
+) -> dict[str, Game]:
     """
     Fetch NBA game data for a given date and return a dictionary mapping game IDs to Game objects.
 
     :param game_date: The date for which to fetch the games.
+    :param proxy: The proxy to use, a new one is resolved if not given.
     :return: A dictionary where each key is a game ID and the value is the corresponding Game object.
     :raises RuntimeError: If fetching NBA data fails.
     """
-    proxy = FreeProxy(https=True).get()
+    if proxy is None:
+        proxy = FreeProxy(https=True).get()
     try:
         scoreboard = scoreboardv2.ScoreboardV2(
             day_offset=0, game_date=game_date, proxy=proxy
@@ -56,36 +183,60 @@ def fetch_nba_game_data(game_date: datetime) -> dict[str, Game]:
         raise RuntimeError(f"Failed to fetch NBA data: {e}") from e
 
     games: dict[str, Game] = {}
-    game_headers: list[Any] = scoreboard.game_header.get_dict().get("data", [])
-    line_scores: list[Any] = scoreboard.line_score.get_dict().get("data", [])
-    east_conf_standings: list[
-        Any
-    ] = scoreboard.east_conf_standings_by_day.get_dict().get("data", [])
-    west_conf_standings: list[
-        Any
-    ] = scoreboard.west_conf_standings_by_day.get_dict().get("data", [])
-    team_leaders: list[Any] = scoreboard.team_leaders.get_dict().get("data", [])
-
-    process_game_headers(games, game_headers)
-    process_line_scores(games, line_scores)
-    process_team_leaders(games, team_leaders)
-    process_conf_standings(games, east_conf_standings)
-    process_conf_standings(games, west_conf_standings)
+    game_headers, game_header_decoder = get_result_set(
+        scoreboard.game_header.get_dict(), GAME_HEADER_FIELDS
+    )
+    line_scores, line_score_decoder = get_result_set(
+        scoreboard.line_score.get_dict(), LINE_SCORE_FIELDS
+    )
+    east_conf_standings, east_conf_standings_decoder = get_result_set(
+        scoreboard.east_conf_standings_by_day.get_dict(), CONF_STANDINGS_FIELDS
+    )
+    west_conf_standings, west_conf_standings_decoder = get_result_set(
+        scoreboard.west_conf_standings_by_day.get_dict(), CONF_STANDINGS_FIELDS
+    )
+    team_leaders, team_leaders_decoder = get_result_set(
+        scoreboard.team_leaders.get_dict(), TEAM_LEADERS_FIELDS
+    )
+
+    process_game_headers(games, game_headers, game_header_decoder)
+    process_line_scores(games, line_scores, line_score_decoder)
+    process_team_leaders(games, team_leaders, team_leaders_decoder)
+    process_conf_standings(games, east_conf_standings, east_conf_standings_decoder)
+    process_conf_standings(games, west_conf_standings, west_conf_standings_decoder)
 
     return games
 
 
-def fetch_nba_play_by_play_data(game_id: str) -> int:
+def get_result_set(
+    result_set: dict[str, Any], fields: Sequence[str]
+) -> tuple[list[Any], RowDecoder]:
+    """
+    Get the rows of a result set together with a decoder for the given fields.
+
+    :param result_set: A result set dictionary with 'headers' and 'data' keys.
+    :param fields: The columns to extract from each row.
+    :return: A tuple with the rows and the compiled RowDecoder.
+    :raises RuntimeError: If the result set does not match the expected schema.
+    """
+    rows: list[Any] = result_set.get("data", [])
+    decoder = compile_row_decoder(result_set.get("headers", []), fields)
+    return rows, decoder
+
+
+def fetch_nba_play_by_play_data(game_id: str, proxy: str | None = None) -> int:
     """
     Calculate the number of lead changes in a game using play-by-play data.
 
     The SCORE field in the JSON output is expected to be in the format 'visitor_score - home_score'.
 
     :param game_id: The unique identifier for the game.
+    :param proxy: The proxy to use, a new one is resolved if not given.
     :return: The total number of lead changes.
     """
 
-    proxy = FreeProxy(https=True).get()
+    if proxy is None:
+        proxy = FreeProxy(https=True).get()
     try:
         pbp_data = playbyplayv2.PlayByPlayV2(game_id=game_id, proxy=proxy).get_dict()
     except Exception as e:
@@ -98,74 +249,101 @@ def fetch_nba_play_by_play_data(game_id: str) -> int:
     return process_lead_changes(playbyplay_rows, playbyplay_headers)
 
 
-def process_game_headers(games: dict[str, Game], game_headers: list[Any]) -> None:
+def process_game_headers(
+    games: dict[str, Game],
+    game_headers: list[Any],
+    decoder: RowDecoder = GAME_HEADER_DECODER,
+) -> None:
     """
     Process game header data to create Game objects and store them in the games dictionary.
 
     :param games: Dictionary to store Game objects keyed by game ID.
     :param game_headers: List of game header data.
+    :param decoder: RowDecoder for GAME_HEADER_FIELDS.
     """
-    for game_header in game_headers:
+    for (
+        game_date,
+        game_id,
+        game_status_id,
+        game_status_text,
+        home_team_id,
+        visitor_team_id,
+    ) in map(decoder, game_headers):
         game = Game(
-            date=datetime.fromisoformat(game_header[0]),
-            game_id=game_header[2],
-            home_team=Team(team_id=game_header[6]),
-            visitor_team=Team(team_id=game_header[7]),
+            date=datetime.fromisoformat(game_date),
+            game_id=game_id,
+            home_team=Team(team_id=home_team_id),
+            visitor_team=Team(team_id=visitor_team_id),
             game_rating=GameRating(),
+            game_status_id=game_status_id,
+            game_status_text=game_status_text.strip(),
         )
         games[game.game_id] = game
 
 
-def process_line_scores(games: dict[str, Game], line_scores: list[Any]) -> None:
+def process_line_scores(
+    games: dict[str, Game],
+    line_scores: list[Any],
+    decoder: RowDecoder = LINE_SCORE_DECODER,
+) -> None:
     """
     Process line score data and update the corresponding Game objects.
 
     :param games: Dictionary of Game objects.
     :param line_scores: List of line score data.
+    :param decoder: RowDecoder for LINE_SCORE_FIELDS.
     """
-    for line_score in line_scores:
-        game_id = line_score[2]
-        team_id = line_score[3]
+    for game_id, team_id, abbreviation, city_name, name, points in map(
+        decoder, line_scores
+    ):
         game = games.get(game_id)
         if not game:
             continue
 
         if game.home_team.team_id == team_id:
-            game.home_team.team_abbreviation = line_score[4]
-            game.home_team.team_city_name = line_score[5]
-            game.home_team.team_name = line_score[6]
-            game.home_team_points = line_score[22]
+            game.home_team.team_abbreviation = abbreviation
+            game.home_team.team_city_name = city_name
+            game.home_team.team_name = name
+            game.home_team_points = points
         else:
-            game.visitor_team.team_abbreviation = line_score[4]
-            game.visitor_team.team_city_name = line_score[5]
-            game.visitor_team.team_name = line_score[6]
-            game.visitor_team_points = line_score[22]
+            game.visitor_team.team_abbreviation = abbreviation
+            game.visitor_team.team_city_name = city_name
+            game.visitor_team.team_name = name
+            game.visitor_team_points = points
 
 
-def process_team_leaders(games: dict[str, Game], team_leaders: list[Any]) -> None:
+def process_team_leaders(
+    games: dict[str, Game],
+    team_leaders: list[Any],
+    decoder: RowDecoder = TEAM_LEADERS_DECODER,
+) -> None:
     """
     Process team leader data to update the maximum points scored by a player for each game.
 
     :param games: Dictionary of Game objects.
     :param team_leaders: List of team leader data.
+    :param decoder: RowDecoder for TEAM_LEADERS_FIELDS.
     """
-    for leader in team_leaders:
-        game_id = leader[0]
+    for game_id, points in map(decoder, team_leaders):
         if game := games.get(game_id):
-            # leader[7] holds the player's points
-            game.maximum_points_player = max(game.maximum_points_player, leader[7])
+            game.maximum_points_player = max(game.maximum_points_player, points)
 
 
-def process_conf_standings(games: dict[str, Game], conf_standings: list[Any]) -> None:
+def process_conf_standings(
+    games: dict[str, Game],
+    conf_standings: list[Any],
+    decoder: RowDecoder = CONF_STANDINGS_DECODER,
+) -> None:
     """
     Process conference standings and update the corresponding teams in each game.
 
     :param games: Dictionary of Game objects.
     :param conf_standings: List of conference standings data.
+    :param decoder: RowDecoder for CONF_STANDINGS_FIELDS.
     """
-    for position, standing in enumerate(conf_standings, start=1):
-        team_id = standing[0]
-        conference = standing[4]
+    for position, (team_id, conference) in enumerate(
+        map(decoder, conf_standings), start=1
+    ):
         for game in games.values():
             if game.home_team.team_id == team_id:
                 game.home_team.conference = conference
@@ -190,10 +368,11 @@ def process_lead_changes(
     lead_changes = 0
     previous_lead = None  # Possible values: 'home', 'visitor', or 'tie'
 
-    for row in playbyplay_rows:
-        row_data = dict(zip(playbyplay_headers, row))
-        score_str = row_data.get("SCORE")
+    if "SCORE" not in playbyplay_headers:
+        return lead_changes
+    get_score = itemgetter(playbyplay_headers.index("SCORE"))
 
+    for score_str in map(get_score, playbyplay_rows):
         if not score_str or " - " not in score_str:
             continue
 
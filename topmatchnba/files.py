@@ -0,0 +1,30 @@
+import json
+import os
+import tempfile
+from typing import Any
+
+
+def write_json_atomically(path: str, data: Any, **dump_kwargs: Any) -> None:
+    """
+    Write JSON data to a file through a uniquely named temporary file.
+
+    The temporary file is created next to the target and moved into place once
+    complete, so readers never see a partial file and concurrent writers never
+    share a temporary file.
+
+    :param path: The path of the file to write.
+    :param data: The data to serialize.
+    :param dump_kwargs: Keyword arguments passed to json.dump.
+    """
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix=f"{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(file_descriptor, mode="w", encoding="utf-8") as file:
+            json.dump(data, file, **dump_kwargs)
+        # mkstemp creates files readable by the owner only.
+        os.chmod(temporary_path, 0o644)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
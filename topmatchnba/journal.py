@@ -0,0 +1,112 @@
+import json
+import os
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from typing import Any
+
+from topmatchnba.data import Game
+from topmatchnba.data import GameRating
+from topmatchnba.data import Team
+from topmatchnba.files import write_json_atomically
+
+
+@dataclass
+class RunJournal:
+    game_date: datetime
+    games: dict[str, Game] = field(default_factory=dict)
+    rated_game_ids: set[str] = field(default_factory=set)
+
+    def record_rated_game(self, game_id: str) -> None:
+        """
+        Mark a game as rated and persist the journal.
+
+        :param game_id: The unique identifier for the rated game.
+        """
+        self.rated_game_ids.add(game_id)
+        save_journal(self)
+
+
+def get_journal_path(game_date: datetime) -> str:
+    current_dir = os.path.dirname(__file__)
+    return os.path.join(
+        current_dir,
+        "..",
+        ".journal",
+        f"topmatchnba-{game_date.strftime('%d-%m-%Y')}.json",
+    )
+
+
+def game_from_dict(game_dict: dict[str, Any]) -> Game:
+    """
+    Rebuild a Game object from the dictionary produced by dataclasses.asdict.
+
+    :param game_dict: A dictionary with the game data and an ISO formatted date.
+    :return: The corresponding Game object.
+    """
+    return Game(
+        **{
+            **game_dict,
+            "date": datetime.fromisoformat(game_dict["date"]),
+            "home_team": Team(**game_dict["home_team"]),
+            "visitor_team": Team(**game_dict["visitor_team"]),
+            "game_rating": GameRating(**game_dict["game_rating"]),
+        }
+    )
+
+
+def load_journal(game_date: datetime) -> RunJournal | None:
+    """
+    Load the journal of a previous run for the given date.
+
+    :param game_date: The date of the games.
+    :return: The RunJournal of the date, or None if there is no journal.
+    """
+    try:
+        with open(get_journal_path(game_date), encoding="utf-8") as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        return None
+
+    return RunJournal(
+        game_date=game_date,
+        games={
+            game_id: game_from_dict(game_dict)
+            for game_id, game_dict in data["games"].items()
+        },
+        rated_game_ids=set(data["rated_game_ids"]),
+    )
+
+
+def save_journal(journal: RunJournal) -> None:
+    """
+    Persist the fetched games and the rated game IDs of a run.
+
+    The journal is written to a temporary file first, so an interrupted write
+    never leaves a truncated journal behind, even with concurrent runs.
+
+    :param journal: The RunJournal to save.
+    """
+    games = {}
+    for game_id, game in journal.games.items():
+        game_dict = asdict(game)
+        game_dict["date"] = game.date.isoformat()
+        games[game_id] = game_dict
+    data = {"games": games, "rated_game_ids": sorted(journal.rated_game_ids)}
+
+    journal_path = get_journal_path(journal.game_date)
+    os.makedirs(os.path.dirname(journal_path), exist_ok=True)
+    write_json_atomically(journal_path, data)
+
+
+def remove_journal(game_date: datetime) -> None:
+    """
+    Remove the journal of a date once its output has been written.
+
+    :param game_date: The date of the games.
+    """
+    try:
+        os.remove(get_journal_path(game_date))
+    except FileNotFoundError:
+        pass
@@ -1,16 +1,33 @@
-import json
+import argparse
 import os
+from collections.abc import Callable
 from dataclasses import asdict
 from datetime import datetime
 from datetime import timedelta
 
+from topmatchnba.arguments import positive_int
 from topmatchnba.data import fetch_nba_game_data
 from topmatchnba.data import fetch_nba_play_by_play_data
 from topmatchnba.data import Game
+from topmatchnba.files import write_json_atomically
+from topmatchnba.journal import load_journal
+from topmatchnba.journal import remove_journal
+from topmatchnba.journal import RunJournal
+from topmatchnba.journal import save_journal
+from topmatchnba.percentile import get_season
+from topmatchnba.percentile import load_season_rankings
+from topmatchnba.percentile import SeasonRanking
+from topmatchnba.percentile import update_season_rankings
 from topmatchnba.rating import calculate_game_rating
+from topmatchnba.rating import calculate_rating_bounds
+from topmatchnba.schedule import get_expected_game_ids
 
 
-def generate_json_for_games(games: list[Game], output_file: str = "games.json") -> None:
+def generate_json_for_games(
+    games: list[Game],
+    output_file: str = "games.json",
+    season_rankings: dict[str, SeasonRanking] | None = None,
+) -> None:
     """
     Generate a JSON file with game data and their corresponding ratings.
 
@@ -19,48 +36,108 @@ def generate_json_for_games(games: list[Game], output_file: str = "games.json")
 
     :param games: A list of Game objects.
     :param output_file: The filename for the output JSON.
+    :param season_rankings: Optional season rankings used to add each game's
+        season rank and percentile.
     """
     data = []
     for game in games:
         game_dict = asdict(game)
         game_dict["date"] = game.date.isoformat()
-        data.append(
-            {
-                "game": game_dict,
-                "game_rating_total": game.game_rating.total,
-            }
-        )
+        game_entry = {
+            "game": game_dict,
+            "game_rating_total": game.game_rating.total,
+        }
+        if season_rankings:
+            season_ranking = season_rankings[get_season(game.game_id)]
+            game_entry["season_rank"] = season_ranking.rank(game.game_rating.total)
+            game_entry["season_percentile"] = season_ranking.percentile(
+                game.game_rating.total
+            )
+        data.append(game_entry)
 
     current_dir = os.path.dirname(__file__)
     json_file_path = os.path.join(current_dir, "..", "public", output_file)
 
-    with open(json_file_path, mode="w", encoding="utf-8") as file:
-        json.dump(data, file, indent=2)
+    write_json_atomically(json_file_path, data, indent=2)
 
 
-def main(game_date=None) -> None:
+def rate_game(game: Game, journal: RunJournal | None = None) -> None:
     """
-    Main function to fetch NBA game data, update game ratings, sort games by rating,
-    print a summary, and generate a JSON output file.
+    Fetch the lead changes of a game and calculate its rating.
+
+    Games already rated in the journal keep their recorded rating, and newly
+    rated games are recorded in it.
+
+    :param game: The Game object to rate.
+    :param journal: Optional RunJournal of the current run.
     """
-    if not game_date:
-        today = datetime.now()
-        game_date = today - timedelta(days=1)
+    if journal and game.game_id in journal.rated_game_ids:
+        return
 
-    # Fetch games for game_date (yesterday as default)
-    games: dict[str, Game] = fetch_nba_game_data(game_date)
+    game.lead_changes = fetch_nba_play_by_play_data(game.game_id)
+    # calculate_game_rating updates game.game_rating in place.
+    calculate_game_rating(game)
 
-    # Update each game with lead changes and recalculate game rating.
-    for game in games.values():
-        game.lead_changes = fetch_nba_play_by_play_data(game.game_id)
-        # calculate_game_rating updates game.game_rating in place.
-        calculate_game_rating(game)
+    if journal:
+        journal.record_rated_game(game.game_id)
 
-    # Sort games in descending order of total game rating.
-    sorted_games = sorted(
-        games.values(), key=lambda game: game.game_rating.total, reverse=True
-    )
 
+def select_top_games(
+    games: dict[str, Game], top_n: int, journal: RunJournal | None = None
+) -> list[Game]:
+    """
+    Select the top N games by rating, fetching play-by-play data only for the
+    games whose lead changes could still affect the top N order.
+
+    Games are resolved in descending order of their upper rating bound. Once
+    every unresolved game's upper bound is below the N-th best lower bound, the
+    remaining games cannot enter the top N and are skipped. Ties are resolved
+    the same way as a full run, keeping the original order of the games.
+
+    :param games: Dictionary of Game objects with scoreboard data filled in.
+    :param top_n: The number of games to return.
+    :param journal: Optional RunJournal of the current run.
+    :return: The top N games sorted in descending order of total game rating.
+    """
+    bounds = {game_id: calculate_rating_bounds(game) for game_id, game in games.items()}
+    unresolved = set(games)
+
+    while unresolved:
+        lower_bounds = sorted((lower for lower, _ in bounds.values()), reverse=True)
+        threshold = lower_bounds[min(top_n, len(lower_bounds)) - 1]
+        candidates = [
+            game_id for game_id in unresolved if bounds[game_id][1] >= threshold
+        ]
+        if not candidates:
+            break
+
+        game_id = max(candidates, key=lambda candidate: bounds[candidate][1])
+        game = games[game_id]
+        rate_game(game, journal)
+        bounds[game_id] = (game.game_rating.total, game.game_rating.total)
+        unresolved.remove(game_id)
+
+    resolved_games = [
+        game for game_id, game in games.items() if game_id not in unresolved
+    ]
+    return sorted(
+        resolved_games, key=lambda game: game.game_rating.total, reverse=True
+    )[:top_n]
+
+
+def save_games(
+    game_date: datetime, sorted_games: list[Game], update_rankings: bool = True
+) -> None:
+    """
+    Print a summary of the rated games of a day, add them to their season rankings
+    and write the day's JSON output file.
+
+    :param game_date: The date of the games.
+    :param sorted_games: The rated games sorted in descending order of rating.
+    :param update_rankings: Whether to add the games to their season rankings.
+        When False, the games are ranked against the persisted rankings only,
+        e.g. when sorted_games holds a subset of the day's games.
+    """
     # Print summary of game ratings.
     for game in sorted_games:
         print(
@@ -68,9 +145,109 @@ def main(game_date=None) -> None:
             f"Points {game.game_rating.total}"
         )
 
+    if update_rankings:
+        season_rankings = update_season_rankings(sorted_games)
+    else:
+        season_rankings = load_season_rankings(sorted_games)
+
     output_file = f"data/topmatchnba-{game_date.strftime('%d-%m-%Y')}.json"
-    generate_json_for_games(sorted_games, output_file)
+    generate_json_for_games(sorted_games, output_file, season_rankings)
+
+
+def check_can_save(game_date: datetime, can_save: Callable[[], bool] | None) -> None:
+    if can_save is not None and not can_save():
+        raise RuntimeError(
+            f"Not saving games for {game_date.strftime('%Y-%m-%d')}: output is owned "
+            "by another run"
+        )
+
+
+def main(
+    game_date=None,
+    top_n: int | None = None,
+    can_save: Callable[[], bool] | None = None,
+) -> None:
+    """
+    Main function to fetch NBA game data, update game ratings, sort games by rating,
+    print a summary, and generate a JSON output file.
+
+    When top_n is given, only the top N games are rated and written, skipping the
+    play-by-play requests for games that cannot reach the top N. Those games are
+    ranked against the season rankings without being added to them.
+
+    Fetched games and ratings are recorded in a journal as they complete, so a
+    failed run for the same date resumes with only the missing games.
+
+    Dates the season schedule knows have no games are skipped without any
+    scoreboard request and without touching their output file, and scheduled
+    games missing from the scoreboard are reported.
+
+    :param can_save: Optional callable checked right before writing the output,
+        e.g. to make sure a backfill worker still holds the date.
+    :raises RuntimeError: If fetching NBA data fails or can_save returns False.
+    """
+    if not game_date:
+        today = datetime.now()
+        game_date = today - timedelta(days=1)
+
+    journal = load_journal(game_date)
+    if journal is None:
+        try:
+            expected_game_ids = get_expected_game_ids(game_date)
+        except RuntimeError as e:
+            # The scoreboard alone is enough to rate the games.
+            print(f"Could not load the season schedule: {e}")
+            expected_game_ids = None
+        if expected_game_ids == []:
+            print(f"No games scheduled for: {game_date.strftime('%Y-%m-%d')}")
+            return
+
+        # Fetch games for game_date (yesterday as default)
+        journal = RunJournal(game_date=game_date, games=fetch_nba_game_data(game_date))
+        save_journal(journal)
+
+        if expected_game_ids:
+            missing_game_ids = set(expected_game_ids) - set(journal.games)
+            if missing_game_ids:
+                print(f"Missing scheduled games: {', '.join(sorted(missing_game_ids))}")
+    games: dict[str, Game] = journal.games
+
+    if top_n:
+        sorted_games = select_top_games(games, top_n, journal)
+    else:
+        # Update each game with lead changes and recalculate game rating.
+        for game in games.values():
+            rate_game(game, journal)
+
+        # Sort games in descending order of total game rating.
+        sorted_games = sorted(
+            games.values(), key=lambda game: game.game_rating.total, reverse=True
+        )
+
+    check_can_save(game_date, can_save)
+    # The top N games alone would skew the season rankings upwards.
+    save_games(game_date, sorted_games, update_rankings=not top_n)
+    remove_journal(game_date)
+
+
+def cli() -> None:
+    """
+    Command line entry point for main.
+    """
+    parser = argparse.ArgumentParser(description="Rate the NBA games of a day.")
+    parser.add_argument(
+        "--date",
+        type=datetime.fromisoformat,
+        help="Date of the games in YYYY-MM-DD format (yesterday by default).",
+    )
+    parser.add_argument(
+        "--top",
+        type=positive_int,
+        help="Only rate and write the top N games of the day.",
+    )
+    args = parser.parse_args()
+    main(args.date, args.top)
 
 
 if __name__ == "__main__":
-    main()
+    cli()
@@ -0,0 +1,214 @@
+import argparse
+import fcntl
+import json
+import os
+from bisect import bisect_left
+from bisect import bisect_right
+from bisect import insort
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+
+from topmatchnba.data import Game
+from topmatchnba.files import write_json_atomically
+from topmatchnba.query import DATA_DIR
+from topmatchnba.query import is_old_scale
+from topmatchnba.query import iter_archive
+
+
+@dataclass
+class SeasonRanking:
+    season: str
+    ratings: dict[str, int] = field(default_factory=dict)
+    sorted_ratings: list[int] = field(default_factory=list)
+
+    def add(self, game_id: str, total: int) -> None:
+        """
+        Add a game rating to the season, replacing any previous rating of the game.
+
+        :param game_id: The unique identifier for the game.
+        :param total: The total game rating.
+        """
+        previous_total = self.ratings.get(game_id)
+        if previous_total is not None:
+            del self.sorted_ratings[bisect_left(self.sorted_ratings, previous_total)]
+        self.ratings[game_id] = total
+        insort(self.sorted_ratings, total)
+
+    def rank(self, total: int) -> int:
+        """
+        Calculate the season rank of a rating, 1 being the best rated game.
+
+        :param total: The total game rating.
+        :return: One plus the number of season games rated higher.
+        """
+        return len(self.sorted_ratings) - bisect_right(self.sorted_ratings, total) + 1
+
+    def percentile(self, total: int) -> float:
+        """
+        Calculate the season percentile of a rating.
+
+        :param total: The total game rating.
+        :return: The percentage of season games rated at or below the rating.
+        """
+        if not self.sorted_ratings:
+            return 0.0
+        at_or_below = bisect_right(self.sorted_ratings, total)
+        return round(100 * at_or_below / len(self.sorted_ratings), 1)
+
+
+def get_season(game_id: str) -> str:
+    """
+    Get the starting year of the season a game belongs to.
+
+    Game IDs follow the format '00SYYNNNNN', where YY are the last two digits
+    of the year the season starts.
+
+    :param game_id: The unique identifier for the game.
+    :return: The starting year of the season, e.g. '2024' for 2024-25.
+    """
+    return f"20{game_id[3:5]}"
+
+
+def get_season_ranking_path(season: str) -> str:
+    current_dir = os.path.dirname(__file__)
+    return os.path.join(
+        current_dir, "..", "public", "data", f"season-ratings-{season}.json"
+    )
+
+
+def load_season_ranking(season: str) -> SeasonRanking:
+    """
+    Load the persisted ratings of a season, or an empty ranking if there are none.
+
+    :param season: The starting year of the season.
+    :return: The SeasonRanking of the season.
+    """
+    try:
+        with open(get_season_ranking_path(season), encoding="utf-8") as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        return SeasonRanking(season=season)
+
+    return SeasonRanking(
+        season=season,
+        ratings=data["ratings"],
+        sorted_ratings=data["sorted_ratings"],
+    )
+
+
+def save_season_ranking(season_ranking: SeasonRanking) -> None:
+    """
+    Persist the ratings of a season next to the daily data files.
+
+    :param season_ranking: The SeasonRanking to save.
+    """
+    data = {
+        "season": season_ranking.season,
+        "sorted_ratings": season_ranking.sorted_ratings,
+        "ratings": season_ranking.ratings,
+    }
+    write_json_atomically(get_season_ranking_path(season_ranking.season), data)
+
+
+@contextmanager
+def lock_season_ranking(season: str) -> Iterator[None]:
+    """
+    Hold an exclusive lock on the ratings file of a season, so concurrent runs
+    do not overwrite each other's updates.
+
+    :param season: The starting year of the season.
+    """
+    with open(f"{get_season_ranking_path(season)}.lock", mode="w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def load_season_rankings(games: list[Game]) -> dict[str, SeasonRanking]:
+    """
+    Load the season rankings of the given games without adding their ratings.
+
+    :param games: A list of Game objects.
+    :return: A dictionary mapping each season to its SeasonRanking.
+    """
+    return {
+        season: load_season_ranking(season)
+        for season in {get_season(game.game_id) for game in games}
+    }
+
+
+def update_season_rankings(games: list[Game]) -> dict[str, SeasonRanking]:
+    """
+    Add the ratings of the given games to their season rankings and persist them.
+
+    :param games: A list of rated Game objects.
+    :return: A dictionary mapping each season to its updated SeasonRanking.
+    """
+    games_by_season: dict[str, list[Game]] = {}
+    for game in games:
+        games_by_season.setdefault(get_season(game.game_id), []).append(game)
+
+    season_rankings: dict[str, SeasonRanking] = {}
+    for season, season_games in games_by_season.items():
+        with lock_season_ranking(season):
+            season_ranking = load_season_ranking(season)
+            for game in season_games:
+                season_ranking.add(game.game_id, game.game_rating.total)
+            save_season_ranking(season_ranking)
+        season_rankings[season] = season_ranking
+
+    return season_rankings
+
+
+def seed_season_rankings(data_dir: str = DATA_DIR) -> dict[str, SeasonRanking]:
+    """
+    Add the ratings of every game of the daily archive to their season rankings.
+
+    Ratings already in a ranking are replaced by the archived ones, so seeding
+    more than once is harmless. Archive entries written before the current
+    rating scale, without a game_rating_total, are skipped.
+
+    :param data_dir: The directory holding the daily archive files.
+    :return: A dictionary mapping each season to its updated SeasonRanking.
+    """
+    totals_by_season: dict[str, dict[str, int]] = {}
+    for _, path in iter_archive(datetime.min, datetime.max, data_dir):
+        with open(path, encoding="utf-8") as file:
+            day_entries = json.load(file)
+        for entry in day_entries:
+            if is_old_scale(entry):
+                continue
+            game_id = entry["game"]["game_id"]
+            totals_by_season.setdefault(get_season(game_id), {})[game_id] = entry[
+                "game_rating_total"
+            ]
+
+    season_rankings: dict[str, SeasonRanking] = {}
+    for season, totals in totals_by_season.items():
+        with lock_season_ranking(season):
+            season_ranking = load_season_ranking(season)
+            for game_id, total in totals.items():
+                season_ranking.add(game_id, total)
+            save_season_ranking(season_ranking)
+        season_rankings[season] = season_ranking
+
+    return season_rankings
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Seed the season rankings from the daily archive."
+    )
+    parser.parse_args()
+
+    for season, season_ranking in sorted(seed_season_rankings().items()):
+        print(f"Season {season}: {len(season_ranking.sorted_ratings)} rated games")
+
+
+if __name__ == "__main__":
+    main()
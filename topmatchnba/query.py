@@ -0,0 +1,340 @@
+import argparse
+import heapq
+import json
+import os
+import re
+from collections.abc import Callable
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from datetime import timedelta
+from itertools import chain
+from typing import Any
+from typing import TypeVar
+
+from topmatchnba.arguments import positive_int
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "public", "data")
+DAY_FILE_PATTERN = re.compile(r"^topmatchnba-(\d{2}-\d{2}-\d{4})\.json$")
+
+RATING_COMPONENTS = (
+    "standings",
+    "score_difference",
+    "maximum_points_player",
+    "change_lead",
+)
+
+# A ranked game: (rating total, date, game ID, archive entry).
+RankedGame = tuple[int, str, str, dict[str, Any]]
+QueryResult = TypeVar("QueryResult")
+
+
+def is_old_scale(entry: dict[str, Any]) -> bool:
+    # Older archive files store the rating as game_punctuation, on a scale
+    # without lead changes that peaks at 16 instead of 24.
+    return "game_rating_total" not in entry
+
+
+@dataclass(frozen=True)
+class GameFilter:
+    team: str | None = None
+    conference: str | None = None
+    min_rating_components: dict[str, int] = field(default_factory=dict)
+    include_old_scale: bool = False
+
+    def matches(self, entry: dict[str, Any]) -> bool:
+        """
+        Check if an archive entry passes the filter.
+
+        Entries of the old rating scale only pass when include_old_scale is set,
+        and never pass a filter on rating components.
+
+        :param entry: An entry of a daily archive file.
+        :return: True if the entry matches every condition of the filter.
+        """
+        if not self.include_old_scale and is_old_scale(entry):
+            return False
+        game = entry["game"]
+        teams = (game["home_team"], game["visitor_team"])
+        if self.team and not any(
+            self.team.lower()
+            in (team["team_abbreviation"].lower(), team["team_name"].lower())
+            for team in teams
+        ):
+            return False
+        if self.conference and not any(
+            team["conference"].lower() == self.conference.lower() for team in teams
+        ):
+            return False
+        if self.min_rating_components:
+            game_rating = game.get("game_rating")
+            if game_rating is None:
+                return False
+            return all(
+                game_rating[component] >= minimum
+                for component, minimum in self.min_rating_components.items()
+            )
+        return True
+
+
+def get_game_rating_total(entry: dict[str, Any]) -> int:
+    return entry.get("game_rating_total", entry.get("game_punctuation", 0))
+
+
+def iter_archive(
+    start_date: datetime, end_date: datetime, data_dir: str = DATA_DIR
+) -> Iterator[tuple[datetime, str]]:
+    """
+    Iterate over the daily archive files between two dates, both included.
+
+    :param start_date: The first date to include.
+    :param end_date: The last date to include.
+    :param data_dir: The directory holding the daily archive files.
+    :return: An iterator of (date, path) tuples, in no particular order.
+    """
+    with os.scandir(data_dir) as entries:
+        for dir_entry in entries:
+            match = DAY_FILE_PATTERN.match(dir_entry.name)
+            if not match:
+                continue
+            game_date = datetime.strptime(match.group(1), "%d-%m-%Y")
+            if start_date <= game_date <= end_date:
+                yield game_date, dir_entry.path
+
+
+def get_archive_date_range(
+    data_dir: str = DATA_DIR,
+) -> tuple[datetime, datetime] | None:
+    """
+    Get the first and last dates of the daily archive.
+
+    :param data_dir: The directory holding the daily archive files.
+    :return: A (first, last) tuple, or None if the archive is empty.
+    """
+    date_range = None
+    for game_date, _ in iter_archive(datetime.min, datetime.max, data_dir):
+        if date_range is None:
+            date_range = (game_date, game_date)
+        else:
+            date_range = (min(date_range[0], game_date), max(date_range[1], game_date))
+    return date_range
+
+
+def iter_ranked_games(
+    start_date: datetime,
+    end_date: datetime,
+    game_filter: GameFilter,
+    data_dir: str = DATA_DIR,
+) -> Iterator[tuple[datetime, Iterator[RankedGame]]]:
+    """
+    Stream the matching games of each archive day, loading one day at a time.
+
+    :return: An iterator of (date, games) tuples, where games are sorted in
+        descending order of rating like the daily files.
+    """
+    for game_date, path in iter_archive(start_date, end_date, data_dir):
+        with open(path, encoding="utf-8") as file:
+            day_entries = json.load(file)
+        yield game_date, (
+            (
+                get_game_rating_total(entry),
+                game_date.strftime("%Y-%m-%d"),
+                entry["game"]["game_id"],
+                entry,
+            )
+            for entry in day_entries
+            if game_filter.matches(entry)
+        )
+
+
+def top_games(
+    top_k: int,
+    start_date: datetime,
+    end_date: datetime,
+    game_filter: GameFilter,
+    data_dir: str = DATA_DIR,
+) -> list[RankedGame]:
+    """
+    Find the best rated games between two dates with a heap of at most top_k games.
+
+    Each daily file is already sorted by rating, so a day is abandoned as soon as
+    its games can no longer enter the heap.
+
+    :return: The top_k games sorted in descending order of rating.
+    """
+    heap: list[RankedGame] = []
+    for _, day_games in iter_ranked_games(start_date, end_date, game_filter, data_dir):
+        for ranked_game in day_games:
+            if len(heap) < top_k:
+                heapq.heappush(heap, ranked_game)
+            elif ranked_game[0] >= heap[0][0]:
+                heapq.heappushpop(heap, ranked_game)
+            else:
+                break
+    return sorted(heap, reverse=True)
+
+
+def best_game_per_week(
+    start_date: datetime,
+    end_date: datetime,
+    game_filter: GameFilter,
+    data_dir: str = DATA_DIR,
+) -> dict[str, RankedGame]:
+    """
+    Find the best rated game of each ISO week between two dates.
+
+    :return: A dictionary mapping each week, formatted as 'YYYY-Www', to its best game.
+    """
+    best_games: dict[str, RankedGame] = {}
+    for game_date, day_games in iter_ranked_games(
+        start_date, end_date, game_filter, data_dir
+    ):
+        year, week, _ = game_date.isocalendar()
+        week_key = f"{year}-W{week:02d}"
+        # The first matching game of a day is its best one.
+        day_best = next(day_games, None)
+        if day_best and (
+            week_key not in best_games or day_best[:3] > best_games[week_key][:3]
+        ):
+            best_games[week_key] = day_best
+    return best_games
+
+
+def split_date_range(
+    start_date: datetime, end_date: datetime, parts: int
+) -> list[tuple[datetime, datetime]]:
+    """
+    Split a date range into at most `parts` contiguous ranges.
+
+    :return: A list of (start, end) tuples covering the range, both ends included.
+    """
+    days = (end_date - start_date).days + 1
+    part_days = max(1, -(-days // parts))
+    ranges = []
+    current_date = start_date
+    while current_date <= end_date:
+        part_end = min(current_date + timedelta(days=part_days - 1), end_date)
+        ranges.append((current_date, part_end))
+        current_date = part_end + timedelta(days=1)
+    return ranges
+
+
+def map_date_ranges(
+    query: Callable[..., QueryResult],
+    arguments: list[tuple[Any, ...]],
+    workers: int,
+) -> list[QueryResult]:
+    """
+    Run a query once per set of arguments, in worker processes if workers > 1.
+
+    :return: The results of each run, in the order of the arguments.
+    """
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(query, *zip(*arguments)))
+    return [query(*query_arguments) for query_arguments in arguments]
+
+
+def run_query(
+    top_k: int | None,
+    start_date: datetime,
+    end_date: datetime,
+    game_filter: GameFilter,
+    workers: int = 1,
+    data_dir: str = DATA_DIR,
+) -> list[RankedGame]:
+    """
+    Run a top_k query, or a best game per week query if top_k is None, optionally
+    splitting the date range across worker processes.
+
+    :return: The resulting games sorted in descending order of rating, or by week
+        for a best game per week query.
+    """
+    date_ranges = split_date_range(start_date, end_date, workers)
+
+    if top_k is not None:
+        top_results = map_date_ranges(
+            top_games,
+            [(top_k, start, end, game_filter, data_dir) for start, end in date_ranges],
+            workers,
+        )
+        return heapq.nlargest(
+            top_k, chain.from_iterable(top_results), key=lambda game: game[:3]
+        )
+
+    week_results = map_date_ranges(
+        best_game_per_week,
+        [(start, end, game_filter, data_dir) for start, end in date_ranges],
+        workers,
+    )
+    best_games: dict[str, RankedGame] = {}
+    for week_key, ranked_game in chain.from_iterable(
+        result.items() for result in week_results
+    ):
+        if week_key not in best_games or ranked_game[:3] > best_games[week_key][:3]:
+            best_games[week_key] = ranked_game
+    return [best_games[week_key] for week_key in sorted(best_games)]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Query the best rated games of the daily archive."
+    )
+    parser.add_argument("--top", type=positive_int, default=25, help="Number of games.")
+    parser.add_argument(
+        "--per-week", action="store_true", help="Best game of each week instead."
+    )
+    parser.add_argument("--start", type=datetime.fromisoformat)
+    parser.add_argument("--end", type=datetime.fromisoformat)
+    parser.add_argument("--team", help="Team abbreviation or name.")
+    parser.add_argument("--conference", help="East or West.")
+    for component in RATING_COMPONENTS:
+        parser.add_argument(
+            f"--min-{component.replace('_', '-')}",
+            type=int,
+            dest=component,
+            help=f"Minimum {component.replace('_', ' ')} rating.",
+        )
+    parser.add_argument(
+        "--include-old-scale",
+        action="store_true",
+        help="Include games rated on the old scale without lead changes.",
+    )
+    parser.add_argument("--workers", type=positive_int, default=1)
+    args = parser.parse_args()
+
+    game_filter = GameFilter(
+        team=args.team,
+        conference=args.conference,
+        include_old_scale=args.include_old_scale,
+        min_rating_components={
+            component: minimum
+            for component in RATING_COMPONENTS
+            if (minimum := getattr(args, component)) is not None
+        },
+    )
+    archive_date_range = get_archive_date_range()
+    if archive_date_range is None:
+        return
+    start_date = args.start or archive_date_range[0]
+    end_date = args.end or archive_date_range[1]
+
+    for total, game_date, _, entry in run_query(
+        None if args.per_week else args.top,
+        start_date,
+        end_date,
+        game_filter,
+        args.workers,
+    ):
+        game = entry["game"]
+        old_scale_label = " (old scale)" if is_old_scale(entry) else ""
+        print(
+            f"{game_date} {game['home_team']['team_name']} - "
+            f"{game['visitor_team']['team_name']}: Points {total}{old_scale_label}"
+        )
+
+
+if __name__ == "__main__":
+    main()
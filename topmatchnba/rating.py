@@ -1,5 +1,8 @@
 from topmatchnba.data import Game
 
+# Highest rating calculate_change_lead can award.
+MAX_CHANGE_LEAD_RATING = 10
+
 
 def calculate_game_rating(game: Game) -> Game:
     """
@@ -30,6 +33,25 @@ def calculate_game_rating(game: Game) -> Game:
     return game
 
 
+def calculate_rating_bounds(game: Game) -> tuple[int, int]:
+    """
+    Calculate the lowest and highest total rating a game can reach before its
+    lead changes are known.
+
+    Every component except the change in lead is derived from scoreboard data,
+    so the bounds only differ by the range of calculate_change_lead.
+
+    :param game: A Game object with scoreboard data filled in.
+    :return: A (lower, upper) tuple with the rating bounds.
+    """
+    known_rating = (
+        calculate_score_difference(game)
+        + calculate_standings(game)
+        + calculate_maximum_points_player(game)
+    )
+    return known_rating, known_rating + MAX_CHANGE_LEAD_RATING
+
+
 def calculate_change_lead(game: Game) -> int:
     """
     Calculate the game rating based on the number of lead changes.
@@ -0,0 +1,205 @@
+import json
+import os
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from datetime import timedelta
+from typing import Any
+
+from fp.fp import FreeProxy
+from nba_api.stats.library.http import NBAStatsHTTP
+
+from topmatchnba.data import GAME_DATE_TIMEZONE
+from topmatchnba.files import write_json_atomically
+
+# Stats endpoint with the full league schedule of a season, including
+# preseason, NBA Cup, All-Star, play-in and playoff games, and games yet to
+# be played or postponed.
+SCHEDULE_ENDPOINT = "scheduleleaguev2"
+
+
+@dataclass
+class SeasonSchedule:
+    season: str
+    # Time of the fetch in the US Eastern time zone.
+    fetched_at: datetime
+    game_ids_by_date: dict[str, list[str]] = field(default_factory=dict)
+
+    def covers(self, game_date: datetime) -> bool:
+        # Games can still be postponed or rescheduled until their date is over,
+        # so only schedules fetched on a later day are trusted for a date.
+        return game_date.date() < self.fetched_at.date()
+
+    def get_game_ids(self, game_date: datetime) -> list[str]:
+        return self.game_ids_by_date.get(game_date.strftime("%Y-%m-%d"), [])
+
+
+def get_season_for_date(game_date: datetime) -> str:
+    """
+    Get the starting year of the season a date belongs to.
+
+    Dates from August onwards belong to the season starting that year.
+
+    :param game_date: The date of the games.
+    :return: The starting year of the season, e.g. '2024' for 2024-25.
+    """
+    year = game_date.year if game_date.month >= 8 else game_date.year - 1
+    return str(year)
+
+
+def get_season_schedule_path(season: str) -> str:
+    current_dir = os.path.dirname(__file__)
+    return os.path.join(current_dir, "..", "public", "data", f"schedule-{season}.json")
+
+
+def fetch_season_schedule(season: str) -> SeasonSchedule:
+    """
+    Fetch the game IDs of every date of a season from the league schedule.
+
+    :param season: The starting year of the season.
+    :return: The SeasonSchedule of the season.
+    :raises RuntimeError: If fetching NBA data fails.
+    """
+    season_param = f"{season}-{str(int(season) + 1)[2:]}"
+    fetched_at = datetime.now(GAME_DATE_TIMEZONE).replace(tzinfo=None)
+
+    proxy = FreeProxy(https=True).get()
+    try:
+        schedule_data = (
+            NBAStatsHTTP()
+            .send_api_request(
+                endpoint=SCHEDULE_ENDPOINT,
+                parameters={"LeagueID": "00", "Season": season_param},
+                proxy=proxy,
+            )
+            .get_dict()
+        )
+    except Exception as e:
+        raise RuntimeError(f"Failed to fetch NBA data ScheduleLeagueV2: {e}") from e
+
+    return SeasonSchedule(
+        season=season,
+        fetched_at=fetched_at,
+        game_ids_by_date=process_schedule_game_dates(
+            schedule_data["leagueSchedule"]["gameDates"]
+        ),
+    )
+
+
+def process_schedule_game_dates(game_dates: list[Any]) -> dict[str, list[str]]:
+    """
+    Group the games of a league schedule by their US Eastern date.
+
+    :param game_dates: The gameDates list of a league schedule.
+    :return: A dictionary mapping each 'YYYY-MM-DD' date to its game IDs.
+    """
+    game_ids_by_date: dict[str, list[str]] = {}
+    for schedule_date in game_dates:
+        for game in schedule_date["games"]:
+            game_ids_by_date.setdefault(game["gameDateEst"][:10], []).append(
+                game["gameId"]
+            )
+    return game_ids_by_date
+
+
+def load_season_schedule(season: str) -> SeasonSchedule | None:
+    """
+    Load the cached schedule of a season.
+
+    :param season: The starting year of the season.
+    :return: The cached SeasonSchedule, or None if there is none.
+    """
+    try:
+        with open(get_season_schedule_path(season), encoding="utf-8") as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        return None
+    # Schedules cached from the league game log did not list every game.
+    if "fetched_at" not in data:
+        return None
+
+    return SeasonSchedule(
+        season=season,
+        fetched_at=datetime.fromisoformat(data["fetched_at"]),
+        game_ids_by_date=data["game_ids_by_date"],
+    )
+
+
+def save_season_schedule(season_schedule: SeasonSchedule) -> None:
+    data = {
+        "season": season_schedule.season,
+        "fetched_at": season_schedule.fetched_at.isoformat(),
+        "game_ids_by_date": season_schedule.game_ids_by_date,
+    }
+    write_json_atomically(
+        get_season_schedule_path(season_schedule.season),
+        data,
+        indent=2,
+        sort_keys=True,
+    )
+
+
+def get_season_schedule(season: str, game_date: datetime) -> SeasonSchedule:
+    """
+    Get the schedule of a season covering the given date, using the cached
+    calendar when it does and refreshing it otherwise.
+
+    :param season: The starting year of the season.
+    :param game_date: The last date the schedule should cover.
+    :return: The SeasonSchedule of the season.
+    :raises RuntimeError: If fetching NBA data fails.
+    """
+    season_schedule = load_season_schedule(season)
+    if season_schedule is None or not season_schedule.covers(game_date):
+        season_schedule = fetch_season_schedule(season)
+        save_season_schedule(season_schedule)
+    return season_schedule
+
+
+def plan_dates(
+    start_date: datetime, end_date: datetime
+) -> list[tuple[datetime, list[str] | None]]:
+    """
+    Plan the dates to fetch between two dates, both included, skipping the
+    dates the season schedule knows have no games.
+
+    :param start_date: The first date to plan.
+    :param end_date: The last date to plan.
+    :return: A list of (date, expected game IDs) tuples. Dates the schedule
+        does not cover yet are kept with None as expected game IDs.
+    :raises RuntimeError: If fetching NBA data fails.
+    """
+    season_schedules: dict[str, SeasonSchedule] = {}
+    planned_dates: list[tuple[datetime, list[str] | None]] = []
+
+    current_date = start_date
+    while current_date <= end_date:
+        season = get_season_for_date(current_date)
+        if season not in season_schedules:
+            season_end_date = min(end_date, datetime(int(season) + 1, 7, 31))
+            season_schedules[season] = get_season_schedule(season, season_end_date)
+
+        season_schedule = season_schedules[season]
+        if not season_schedule.covers(current_date):
+            planned_dates.append((current_date, None))
+        elif game_ids := season_schedule.get_game_ids(current_date):
+            planned_dates.append((current_date, game_ids))
+
+        current_date += timedelta(days=1)
+
+    return planned_dates
+
+
+def get_expected_game_ids(game_date: datetime) -> list[str] | None:
+    """
+    Get the game IDs the season schedule expects on a date, refreshing the
+    cached schedule if it was fetched before the date was over.
+
+    :param game_date: The date of the games.
+    :return: The expected game IDs, or None if the date is not over yet.
+    :raises RuntimeError: If fetching NBA data fails.
+    """
+    season_schedule = get_season_schedule(get_season_for_date(game_date), game_date)
+    if not season_schedule.covers(game_date):
+        return None
+    return season_schedule.get_game_ids(game_date)
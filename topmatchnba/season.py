@@ -1,15 +1,15 @@
 import time
 from datetime import datetime
-from datetime import timedelta
 
 from topmatchnba.main import main as game_main
+from topmatchnba.schedule import plan_dates
 
 
 def fetch_season_data(start_date: datetime, end_date: datetime):
-    current_date = start_date
     failed_dates = []  # List to keep track of failed requests
 
-    while current_date <= end_date:
+    # Only dates with scheduled games are fetched.
+    for current_date, _ in plan_dates(start_date, end_date):
         try:
             print(f"Fetching data for: {current_date.strftime('%Y-%m-%d')}")
             game_main(current_date)
@@ -23,8 +23,6 @@ def fetch_season_data(start_date: datetime, end_date: datetime):
                 current_date.strftime("%Y-%m-%d")
             )  # Add the failed date to the list
 
-        current_date += timedelta(days=1)
-
     # Save the failed dates to a file for retrying later
     if failed_dates:
         with open("failed_dates.txt", "w") as file:
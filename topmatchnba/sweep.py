@@ -0,0 +1,318 @@
+import argparse
+import csv
+import json
+from dataclasses import dataclass
+from dataclasses import fields
+from datetime import datetime
+
+import numpy as np
+
+from topmatchnba.query import DATA_DIR
+from topmatchnba.query import iter_archive
+
+
+@dataclass
+class History:
+    """
+    Rating inputs of every archived game, one entry per game, sorted by day.
+    """
+
+    day: np.ndarray
+    score_difference: np.ndarray
+    best_position: np.ndarray
+    worst_position: np.ndarray
+    maximum_points_player: np.ndarray
+    lead_changes: np.ndarray
+
+
+@dataclass
+class RatingScales:
+    """
+    Candidate rating scales, one row per candidate.
+
+    Each component awards the points of the first threshold the game passes,
+    checked in column order, mirroring the functions in topmatchnba.rating.
+    """
+
+    # Lead changes above the threshold.
+    change_lead_thresholds: np.ndarray
+    change_lead_points: np.ndarray
+    # Player points above the threshold.
+    maximum_points_thresholds: np.ndarray
+    maximum_points_points: np.ndarray
+    # Score difference below the threshold.
+    score_difference_thresholds: np.ndarray
+    score_difference_points: np.ndarray
+    # Both teams at or above the conference position, then either team.
+    standings_both_thresholds: np.ndarray
+    standings_both_points: np.ndarray
+    standings_either_thresholds: np.ndarray
+    standings_either_points: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.change_lead_thresholds)
+
+    def maximum_totals(self) -> np.ndarray:
+        return (
+            self.change_lead_points.max(axis=1)
+            + self.maximum_points_points.max(axis=1)
+            + self.score_difference_points.max(axis=1)
+            + np.maximum(
+                self.standings_both_points.max(axis=1),
+                self.standings_either_points.max(axis=1),
+            )
+        )
+
+    def describe(self, candidate: int) -> dict[str, str]:
+        return {
+            scale_field.name: "/".join(
+                str(value) for value in getattr(self, scale_field.name)[candidate]
+            )
+            for scale_field in fields(self)
+        }
+
+
+# The scale implemented in topmatchnba.rating.
+BASELINE_SCALES = RatingScales(
+    change_lead_thresholds=np.array([[16, 10, 6, 3]]),
+    change_lead_points=np.array([[10, 8, 6, 2]]),
+    maximum_points_thresholds=np.array([[50, 40]]),
+    maximum_points_points=np.array([[4, 2]]),
+    score_difference_thresholds=np.array([[2, 4, 6, 10]]),
+    score_difference_points=np.array([[10, 8, 6, 4]]),
+    standings_both_thresholds=np.array([[2, 4, 7]]),
+    standings_both_points=np.array([[8, 6, 4]]),
+    standings_either_thresholds=np.array([[3]]),
+    standings_either_points=np.array([[2]]),
+)
+
+
+def load_history(
+    start_date: datetime = datetime.min,
+    end_date: datetime = datetime.max,
+    data_dir: str = DATA_DIR,
+) -> History:
+    """
+    Load the rating inputs of the archived games into arrays.
+
+    Archive files written before lead changes were stored are skipped.
+
+    :return: The History of the games, sorted by day.
+    """
+    days = sorted(iter_archive(start_date, end_date, data_dir))
+    rows = []
+    for day, (_, path) in enumerate(days):
+        with open(path, encoding="utf-8") as file:
+            day_entries = json.load(file)
+        for entry in day_entries:
+            game = entry["game"]
+            if "lead_changes" not in game:
+                continue
+            positions = (
+                game["home_team"]["conference_position"],
+                game["visitor_team"]["conference_position"],
+            )
+            rows.append(
+                (
+                    day,
+                    abs(game["home_team_points"] - game["visitor_team_points"]),
+                    min(positions),
+                    max(positions),
+                    game["maximum_points_player"],
+                    game["lead_changes"],
+                )
+            )
+
+    columns = np.array(rows, dtype=np.int32).reshape(-1, 6).T
+    return History(*columns)
+
+
+def score_component(
+    values: np.ndarray,
+    thresholds: np.ndarray,
+    points: np.ndarray,
+    compare: np.ufunc,
+    default: np.ndarray | int = 0,
+) -> np.ndarray:
+    """
+    Score one component for every candidate and game at once.
+
+    :param values: The input of each game, shape (games,).
+    :param thresholds: The thresholds of each candidate, shape (candidates, k).
+    :param points: The points of each threshold, shape (candidates, k).
+    :param compare: The ufunc a value must pass against a threshold.
+    :param default: The points when no threshold passes.
+    :return: The points of each candidate and game, shape (candidates, games).
+    """
+    scores = np.broadcast_to(default, (len(thresholds), len(values)))
+    # Apply the thresholds in reverse so the first one passed wins.
+    for column in reversed(range(thresholds.shape[1])):
+        scores = np.where(
+            compare(values[None, :], thresholds[:, column, None]),
+            points[:, column, None],
+            scores,
+        )
+    return scores
+
+
+def score_games(history: History, scales: RatingScales) -> np.ndarray:
+    """
+    Calculate the total rating of every game under every candidate scale.
+
+    :return: The totals, shape (candidates, games).
+    """
+    standings = score_component(
+        history.worst_position,
+        scales.standings_both_thresholds,
+        scales.standings_both_points,
+        np.less_equal,
+        score_component(
+            history.best_position,
+            scales.standings_either_thresholds,
+            scales.standings_either_points,
+            np.less_equal,
+        ),
+    )
+    return (
+        standings
+        + score_component(
+            history.score_difference,
+            scales.score_difference_thresholds,
+            scales.score_difference_points,
+            np.less,
+        )
+        + score_component(
+            history.maximum_points_player,
+            scales.maximum_points_thresholds,
+            scales.maximum_points_points,
+            np.greater,
+        )
+        + score_component(
+            history.lead_changes,
+            scales.change_lead_thresholds,
+            scales.change_lead_points,
+            np.greater,
+        )
+    )
+
+
+def generate_scales(
+    count: int, seed: int = 0, baseline: RatingScales = BASELINE_SCALES
+) -> RatingScales:
+    """
+    Generate candidate scales around a baseline, which is kept as candidate 0.
+
+    Thresholds are shifted by up to two units, keeping their order, and the
+    points of each component are scaled by a common factor.
+
+    :param count: The number of candidates, including the baseline.
+    :param seed: The seed of the random generator.
+    :param baseline: The scale to perturb, with a single row.
+    :return: The candidate RatingScales.
+    """
+    rng = np.random.default_rng(seed)
+    candidates = {}
+    for scale_field in fields(baseline):
+        if not scale_field.name.endswith("_thresholds"):
+            continue
+        component = scale_field.name.removesuffix("_thresholds")
+        thresholds = np.repeat(getattr(baseline, scale_field.name), count, axis=0)
+        points = np.repeat(getattr(baseline, f"{component}_points"), count, axis=0)
+
+        shifted = np.maximum(thresholds + rng.integers(-2, 3, size=thresholds.shape), 0)
+        # Keep the thresholds in the baseline's order.
+        descending = thresholds[0, 0] > thresholds[0, -1]
+        shifted = np.sort(shifted, axis=1)
+        if descending:
+            shifted = shifted[:, ::-1]
+        factors = rng.choice([0.5, 0.75, 1.0, 1.25, 1.5], size=(count, 1))
+
+        candidates[scale_field.name] = shifted
+        candidates[f"{component}_points"] = np.rint(points * factors).astype(int)
+
+    scales = RatingScales(**candidates)
+    for scale_field in fields(scales):
+        getattr(scales, scale_field.name)[0] = getattr(baseline, scale_field.name)[0]
+    return scales
+
+
+def summarize(history: History, scales: RatingScales) -> list[dict[str, float]]:
+    """
+    Compute distribution and rank stability statistics of every candidate scale.
+
+    Rank stability is measured against candidate 0: the share of days whose
+    best game under candidate 0 is also a best game of the day under the
+    candidate, and the correlation of the totals.
+
+    :return: One dictionary of statistics per candidate.
+    """
+    totals = score_games(history, scales)
+    new_day = np.diff(history.day, prepend=-1) != 0
+    day_starts = np.flatnonzero(new_day)
+    day_of_game = np.cumsum(new_day) - 1
+    day_maximums = np.maximum.reduceat(totals, day_starts, axis=1)
+    is_day_best = totals == day_maximums[:, day_of_game]
+
+    baseline_best = np.array(
+        [
+            start + np.argmax(totals[0, start:end])
+            for start, end in zip(day_starts, [*day_starts[1:], totals.shape[1]])
+        ]
+    )
+    best_game_agreement = is_day_best[:, baseline_best].mean(axis=1)
+
+    centered = totals - totals.mean(axis=1, keepdims=True)
+    norms = np.sqrt((centered**2).sum(axis=1))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        correlation = (centered @ centered[0]) / (norms * norms[0])
+
+    maximum_totals = scales.maximum_totals()
+    percentiles = np.percentile(totals, [50, 90, 99], axis=1)
+    return [
+        {
+            "candidate": candidate,
+            "maximum_total": int(maximum_totals[candidate]),
+            "observed_maximum": int(totals[candidate].max()),
+            "mean": round(float(totals[candidate].mean()), 2),
+            "std": round(float(totals[candidate].std()), 2),
+            "p50": float(percentiles[0, candidate]),
+            "p90": float(percentiles[1, candidate]),
+            "p99": float(percentiles[2, candidate]),
+            "best_game_agreement": round(float(best_game_agreement[candidate]), 3),
+            "correlation": round(float(np.nan_to_num(correlation[candidate])), 3),
+        }
+        for candidate in range(len(scales))
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Evaluate candidate rating scales over the archived games."
+    )
+    parser.add_argument("--candidates", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start", type=datetime.fromisoformat, default=datetime.min)
+    parser.add_argument("--end", type=datetime.fromisoformat, default=datetime.max)
+    parser.add_argument("--output", default="sweep.csv", help="CSV report path.")
+    args = parser.parse_args()
+
+    history = load_history(args.start, args.end)
+    if not len(history.day):
+        print("No archived games with lead changes to evaluate.")
+        return
+    scales = generate_scales(args.candidates, args.seed)
+    statistics = summarize(history, scales)
+
+    with open(args.output, mode="w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=[*statistics[0], *scales.describe(0)])
+        writer.writeheader()
+        for candidate, candidate_statistics in enumerate(statistics):
+            writer.writerow({**candidate_statistics, **scales.describe(candidate)})
+
+    print(f"Evaluated {len(scales)} scales over {len(history.day)} games.")
+    print(f"Current scale: {statistics[0]}")
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()